@@ -17,6 +17,9 @@ The 8 Chara Karakas:
 7. GK (Gnati Karaka) - Relatives/enemies significator
 8. DK (Dara Karaka) - Spouse significator
 """
+from functools import lru_cache
+from operator import itemgetter
+import re
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
@@ -34,7 +37,7 @@ class CharaKarakaType(str, Enum):
     DK = "DK"   # Dara Karaka - Spouse
 
 
-@dataclass
+@dataclass(slots=True)
 class CharaKaraka:
     """Chara Karaka information"""
     karaka_type: CharaKarakaType
@@ -97,6 +100,12 @@ KARAKA_SIGNIFICATIONS = {
     },
 }
 
+# Top three governed areas per karaka, pre-joined for interpretation text
+_TOP3_AREAS: Dict[CharaKarakaType, str] = {
+    karaka_type: ", ".join(signif["areas"][:3])
+    for karaka_type, signif in KARAKA_SIGNIFICATIONS.items()
+}
+
 # Planets considered for Chara Karaka (7-planet scheme, excluding Rahu)
 # Note: Some use 8-planet scheme including Rahu
 KARAKA_PLANETS = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn"]
@@ -124,6 +133,38 @@ def get_longitude_in_sign(longitude: float) -> float:
     return longitude % 30
 
 
+# Sort key for (planet, degree_in_sign, full_longitude) tuples
+_BY_DEGREE = itemgetter(1)
+
+
+def _rank_planets_by_degree(
+    planet_longitudes: Dict[str, float],
+    include_rahu: bool = False
+) -> List[Tuple[str, float, float]]:
+    """
+    Rank karaka planets by degree within sign (descending).
+    
+    This is the numeric core of the Chara Karaka calculation: a single pass
+    over at most 8 longitudes followed by one small sort.
+    
+    Returns:
+        List of (planet, degree_in_sign, full_longitude), highest degree first
+    """
+    planets = KARAKA_PLANETS
+    if include_rahu and "Rahu" in planet_longitudes:
+        planets = KARAKA_PLANETS + ["Rahu"]
+    
+    planet_degrees = [
+        (planet, planet_longitudes[planet] % 30, planet_longitudes[planet])
+        for planet in planets
+        if planet in planet_longitudes
+    ]
+    
+    # Sort by degree in sign (descending - highest degree = AK)
+    planet_degrees.sort(key=_BY_DEGREE, reverse=True)
+    return planet_degrees
+
+
 def calculate_chara_karakas(
     planet_longitudes: Dict[str, float],
     include_rahu: bool = False
@@ -138,43 +179,98 @@ def calculate_chara_karakas(
     Returns:
         Dict of Karaka type to CharaKaraka object
     """
-    # Get planets to consider
-    planets = KARAKA_PLANETS.copy()
-    if include_rahu and "Rahu" in planet_longitudes:
-        planets.append("Rahu")
-    
-    # Calculate longitude within sign for each planet
-    planet_degrees = []
-    for planet in planets:
-        if planet in planet_longitudes:
-            full_long = planet_longitudes[planet]
-            deg_in_sign = get_longitude_in_sign(full_long)
-            planet_degrees.append((planet, deg_in_sign, full_long))
-    
-    # Sort by degree in sign (descending - highest degree = AK)
-    planet_degrees.sort(key=lambda x: x[1], reverse=True)
+    planet_degrees = _rank_planets_by_degree(planet_longitudes, include_rahu)
     
     # Assign karakas
     karakas = {}
-    karaka_types = KARAKA_ORDER[:len(planet_degrees)]
-    
-    for i, karaka_type in enumerate(karaka_types):
-        if i < len(planet_degrees):
-            planet, deg_in_sign, full_long = planet_degrees[i]
-            signif = KARAKA_SIGNIFICATIONS[karaka_type]
-            
-            karakas[karaka_type] = CharaKaraka(
-                karaka_type=karaka_type,
-                planet=planet,
-                longitude_in_sign=round(deg_in_sign, 2),
-                full_longitude=round(full_long, 2),
-                significance=signif["significance"],
-                areas_governed=signif["areas"],
-            )
+    for karaka_type, (planet, deg_in_sign, full_long) in zip(KARAKA_ORDER, planet_degrees):
+        signif = KARAKA_SIGNIFICATIONS[karaka_type]
+        
+        karakas[karaka_type] = CharaKaraka(
+            karaka_type=karaka_type,
+            planet=planet,
+            longitude_in_sign=round(deg_in_sign, 2),
+            full_longitude=round(full_long, 2),
+            significance=signif["significance"],
+            areas_governed=signif["areas"],
+        )
     
     return karakas
 
 
+# Area to karaka mapping
+_AREA_TO_KARAKA: Dict[str, CharaKarakaType] = {
+    # Career related -> AmK
+    "career": CharaKarakaType.AMK,
+    "job": CharaKarakaType.AMK,
+    "profession": CharaKarakaType.AMK,
+    "work": CharaKarakaType.AMK,
+    
+    # Marriage related -> DK
+    "marriage": CharaKarakaType.DK,
+    "spouse": CharaKarakaType.DK,
+    "partner": CharaKarakaType.DK,
+    "relationships": CharaKarakaType.DK,
+    
+    # Children related -> PK
+    "children": CharaKarakaType.PK,
+    "child": CharaKarakaType.PK,
+    "son": CharaKarakaType.PK,
+    "daughter": CharaKarakaType.PK,
+    
+    # Mother related -> MK
+    "mother": CharaKarakaType.MK,
+    "home": CharaKarakaType.MK,
+    "property": CharaKarakaType.MK,
+    
+    # Father related -> PiK
+    "father": CharaKarakaType.PIK,
+    "fortune": CharaKarakaType.PIK,
+    "dharma": CharaKarakaType.PIK,
+    "guru": CharaKarakaType.PIK,
+    
+    # Siblings related -> BK
+    "siblings": CharaKarakaType.BK,
+    "brother": CharaKarakaType.BK,
+    "sister": CharaKarakaType.BK,
+    "courage": CharaKarakaType.BK,
+    
+    # Enemies/obstacles -> GK
+    "enemies": CharaKarakaType.GK,
+    "obstacles": CharaKarakaType.GK,
+    "health": CharaKarakaType.GK,
+    "legal": CharaKarakaType.GK,
+    
+    # Self/soul -> AK
+    "self": CharaKarakaType.AK,
+    "soul": CharaKarakaType.AK,
+    "spirituality": CharaKarakaType.AK,
+}
+
+# Single-pass keyword scanner for multi-word areas ("marriage and spouse").
+# Longest keywords first so "children" wins over "child".
+_AREA_KEYWORD_RE = re.compile(
+    r"\b(" + "|".join(
+        re.escape(keyword) for keyword in sorted(_AREA_TO_KARAKA, key=len, reverse=True)
+    ) + r")s?\b"
+)
+
+
+@lru_cache(maxsize=256)
+def _resolve_karaka_type(area: str) -> Optional[CharaKarakaType]:
+    """Resolve a life area string to its Chara Karaka type (cached)."""
+    area_key = area.casefold().strip()
+    
+    karaka_type = _AREA_TO_KARAKA.get(area_key)
+    if karaka_type is None:
+        # Fall back to the first known keyword inside the phrase
+        match = _AREA_KEYWORD_RE.search(area_key)
+        if match:
+            karaka_type = _AREA_TO_KARAKA[match.group(1)]
+    
+    return karaka_type
+
+
 def get_karaka_for_area(
     area: str,
     karakas: Dict[CharaKarakaType, CharaKaraka]
@@ -183,66 +279,15 @@ def get_karaka_for_area(
     Get the relevant Chara Karaka for a life area.
     
     Args:
-        area: Life area (career, marriage, etc.)
+        area: Life area (career, marriage, etc.) or a phrase containing one
         karakas: Calculated Chara Karakas
     
     Returns:
         The relevant CharaKaraka or None
     """
-    area_lower = area.lower()
-    
-    # Area to karaka mapping
-    area_karaka_map = {
-        # Career related -> AmK
-        "career": CharaKarakaType.AMK,
-        "job": CharaKarakaType.AMK,
-        "profession": CharaKarakaType.AMK,
-        "work": CharaKarakaType.AMK,
-        
-        # Marriage related -> DK
-        "marriage": CharaKarakaType.DK,
-        "spouse": CharaKarakaType.DK,
-        "partner": CharaKarakaType.DK,
-        "relationships": CharaKarakaType.DK,
-        
-        # Children related -> PK
-        "children": CharaKarakaType.PK,
-        "child": CharaKarakaType.PK,
-        "son": CharaKarakaType.PK,
-        "daughter": CharaKarakaType.PK,
-        
-        # Mother related -> MK
-        "mother": CharaKarakaType.MK,
-        "home": CharaKarakaType.MK,
-        "property": CharaKarakaType.MK,
-        
-        # Father related -> PiK
-        "father": CharaKarakaType.PIK,
-        "fortune": CharaKarakaType.PIK,
-        "dharma": CharaKarakaType.PIK,
-        "guru": CharaKarakaType.PIK,
-        
-        # Siblings related -> BK
-        "siblings": CharaKarakaType.BK,
-        "brother": CharaKarakaType.BK,
-        "sister": CharaKarakaType.BK,
-        "courage": CharaKarakaType.BK,
-        
-        # Enemies/obstacles -> GK
-        "enemies": CharaKarakaType.GK,
-        "obstacles": CharaKarakaType.GK,
-        "health": CharaKarakaType.GK,
-        "legal": CharaKarakaType.GK,
-        
-        # Self/soul -> AK
-        "self": CharaKarakaType.AK,
-        "soul": CharaKarakaType.AK,
-        "spirituality": CharaKarakaType.AK,
-    }
-    
-    karaka_type = area_karaka_map.get(area_lower)
-    if karaka_type and karaka_type in karakas:
-        return karakas[karaka_type]
+    karaka_type = _resolve_karaka_type(area)
+    if karaka_type:
+        return karakas.get(karaka_type)
     
     return None
 
@@ -279,23 +324,24 @@ def analyze_karaka_transit(
     
     # Generate interpretation
     signif = KARAKA_SIGNIFICATIONS[karaka.karaka_type]
+    top_areas = _TOP3_AREAS[karaka.karaka_type]
     
     if transit_status == "Good":
         impact["interpretation"] = (
             f"{karaka_planet} as {signif['name']} is well-placed in transit. "
-            f"This supports matters related to: {', '.join(karaka.areas_governed[:3])}."
+            f"This supports matters related to: {top_areas}."
         )
         impact["outlook"] = "Favorable"
     elif transit_status == "Bad":
         impact["interpretation"] = (
             f"{karaka_planet} as {signif['name']} faces challenges in transit. "
-            f"Be cautious with: {', '.join(karaka.areas_governed[:3])}."
+            f"Be cautious with: {top_areas}."
         )
         impact["outlook"] = "Challenging"
     else:
         impact["interpretation"] = (
             f"{karaka_planet} as {signif['name']} has mixed transit influences. "
-            f"Balanced approach needed for: {', '.join(karaka.areas_governed[:3])}."
+            f"Balanced approach needed for: {top_areas}."
         )
         impact["outlook"] = "Mixed"
     
@@ -340,19 +386,20 @@ def format_karakas_for_display(
     result = []
     
     for karaka_type in KARAKA_ORDER:
-        if karaka_type in karakas:
-            karaka = karakas[karaka_type]
-            signif = KARAKA_SIGNIFICATIONS[karaka_type]
-            
-            result.append({
-                "type": karaka_type.value,
-                "name": signif["name"],
-                "meaning": signif["meaning"],
-                "planet": karaka.planet,
-                "degree_in_sign": karaka.longitude_in_sign,
-                "significance": karaka.significance,
-                "areas": karaka.areas_governed,
-            })
+        karaka = karakas.get(karaka_type)
+        if karaka is None:
+            continue
+        signif = KARAKA_SIGNIFICATIONS[karaka_type]
+        
+        result.append({
+            "type": karaka_type.value,
+            "name": signif["name"],
+            "meaning": signif["meaning"],
+            "planet": karaka.planet,
+            "degree_in_sign": karaka.longitude_in_sign,
+            "significance": karaka.significance,
+            "areas": karaka.areas_governed,
+        })
     
     return result
 
@@ -10,11 +10,12 @@ Based on:
   - Chapter 25: Transits and Natal References
   - Chapter 26: Transits: Miscellaneous Topics
 """
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class DetailedExplanation:
     """Complete explanation for a transit prediction"""
     summary: str
@@ -26,6 +27,86 @@ class DetailedExplanation:
     confidence_breakdown: Dict[str, float]
 
 
+class ExplanationSources(NamedTuple):
+    """
+    Raw inputs of a DetailedExplanation, before any text is formatted.
+    
+    Call render() to materialize the explanation.
+    """
+    area: str
+    area_houses: Tuple[int, ...]
+    n_transits: int
+    supporting_factors: List[Dict]
+    challenging_factors: List[Dict]
+    confidence_pairs: List[Tuple[str, float]]  # (key, weight), in transit order
+    score: float
+    outlook: str
+    
+    def render(self) -> DetailedExplanation:
+        """Format the step-by-step reasoning, why and summary text."""
+        area = self.area
+        score = self.score
+        outlook = self.outlook
+        supporting_factors = self.supporting_factors
+        challenging_factors = self.challenging_factors
+        
+        conclusion_steps = []
+        textbook_refs = []
+        
+        # Step 1: Identify relevant houses for this area
+        houses_csv = ", ".join(map(str, self.area_houses))
+        conclusion_steps.append(
+            f"Step 1: Identified relevant houses for {area}: [{houses_csv}]. "
+            f"These houses govern {_get_house_meanings(self.area_houses)}."
+        )
+        textbook_refs.append("BPHS Ch. 7: Houses and Their Significations")
+        
+        # Step 2: Summarize the transits analyzed
+        n_support = len(supporting_factors)
+        n_challenge = len(challenging_factors)
+        conclusion_steps.append(
+            f"Step 2: Analyzed {self.n_transits} planetary transits. "
+            f"Found {n_support} supporting and {n_challenge} challenging factors."
+        )
+        textbook_refs.append("BPHS Tables 53-59: Transit Results from Moon")
+        
+        # Step 3: Synthesize conclusion
+        if score >= 20:
+            why = (
+                f"The overall score of {score:.1f} indicates favorable transits for {area}. "
+                f"This is because {n_support} planets are positively influencing "
+                f"the houses related to {area} ({houses_csv}), "
+                f"while only {n_challenge} planets pose challenges."
+            )
+        elif score <= -20:
+            why = (
+                f"The overall score of {score:.1f} indicates challenging transits for {area}. "
+                f"This is because {n_challenge} planets are creating obstacles in "
+                f"the houses related to {area} ({houses_csv}), "
+                f"outweighing the {n_support} supporting influences."
+            )
+        else:
+            why = (
+                f"The overall score of {score:.1f} indicates mixed transits for {area}. "
+                f"The {n_support} supporting factors are balanced by "
+                f"{n_challenge} challenging factors. Selective action is recommended."
+            )
+        
+        conclusion_steps.append(f"Step 3: Calculated weighted score: {score:.1f} → {outlook} outlook")
+        conclusion_steps.append(f"Step 4: {why}")
+        textbook_refs.append("Vedic Astrology Ch. 25: Transits and Natal References")
+        
+        return DetailedExplanation(
+            summary=_generate_detailed_summary(area, outlook, supporting_factors, challenging_factors),
+            conclusion_steps=conclusion_steps,
+            why_this_conclusion=why,
+            supporting_factors=supporting_factors,
+            challenging_factors=challenging_factors,
+            textbook_references=textbook_refs,
+            confidence_breakdown=dict(self.confidence_pairs),
+        )
+
+
 # Transit quality descriptions from textbook Tables 53-59
 TRANSIT_RESULTS_DESCRIPTIONS = {
     "Sun": {
@@ -156,6 +237,31 @@ TRANSIT_RESULTS_DESCRIPTIONS = {
     },
 }
 
+# Flattened (planet, house) -> (quality, result) view of the table above
+_TRANSIT_TABLE: Dict[Tuple[str, int], Tuple[str, str]] = {
+    (planet, house): (desc["quality"], desc["result"])
+    for planet, houses in TRANSIT_RESULTS_DESCRIPTIONS.items()
+    for house, desc in houses.items()
+}
+_EMPTY_TRANSIT: Tuple[str, str] = ("Neutral", "mixed results")
+_NO_DESCRIPTIONS: Dict[int, Dict[str, str]] = {}  # shared miss sentinel, never mutated
+
+# final_status -> supporting (True) / challenging (False); other statuses
+# are ignored. Keys are compile-time interned literals, like the status
+# values produced by the analyzers, so lookups usually hit on identity.
+_STATUS_IS_SUPPORT: Dict[str, bool] = {"Good": True, "Bad": False}
+
+# Per-transit reasoning line: (planet, house, textbook result)
+_REASONING_TEMPLATE = "%s transiting %sth house from Moon indicates: %s"
+
+# Pre-built confidence_breakdown keys per planet
+_SUPPORT_KEYS: Dict[str, str] = {
+    planet: f"{planet}_support" for planet in TRANSIT_RESULTS_DESCRIPTIONS
+}
+_CHALLENGE_KEYS: Dict[str, str] = {
+    planet: f"{planet}_challenge" for planet in TRANSIT_RESULTS_DESCRIPTIONS
+}
+
 # House-Area correlations
 HOUSE_AREA_MEANING = {
     1: "self, body, personality, general well-being",
@@ -185,6 +291,62 @@ PLANET_NATURAL_SIGNIFICATIONS = {
     "Ketu": "spirituality, moksha, detachment, loss, past karma",
 }
 
+# Area -> relevant houses
+_AREA_HOUSES: Dict[str, Tuple[int, ...]] = {
+    "career": (10, 6, 2),
+    "job": (6, 10, 2),
+    "business": (7, 10, 11),
+    "finance": (2, 11, 5, 9),
+    "wealth": (2, 11, 5),
+    "health": (1, 6, 8),
+    "marriage": (7, 2, 4, 11),
+    "relationships": (7, 5, 11),
+    "love": (5, 7, 11),
+    "education": (4, 5, 9),
+    "travel": (3, 9, 12),
+    "foreign": (9, 12, 7),
+    "family": (2, 4, 5),
+    "children": (5, 9, 11),
+    "spirituality": (9, 12, 5),
+    "property": (4, 2, 11),
+    "legal": (6, 9, 7),
+    "general": (1, 2, 4, 7, 10),
+}
+_DEFAULT_AREA_HOUSES = _AREA_HOUSES["general"]
+
+# Area -> bitmask of its houses (bit h set for house h)
+_HOUSE_BIT: Dict[int, int] = {house: 1 << house for house in range(13)}
+_AREA_HOUSE_MASK: Dict[str, int] = {
+    area: sum(_HOUSE_BIT[house] for house in houses)
+    for area, houses in _AREA_HOUSES.items()
+}
+_DEFAULT_AREA_HOUSE_MASK = _AREA_HOUSE_MASK["general"]
+
+# Planet -> areas it naturally signifies
+_PLANET_AREAS: Dict[str, FrozenSet[str]] = {
+    planet: frozenset(areas) for planet, areas in {
+        "Sun": ["career", "health", "government", "father"],
+        "Moon": ["family", "health", "travel", "mother"],
+        "Mars": ["property", "health", "legal", "siblings"],
+        "Mercury": ["education", "business", "career", "communication"],
+        "Jupiter": ["finance", "children", "education", "spirituality", "wealth"],
+        "Venus": ["marriage", "relationships", "finance", "love"],
+        "Saturn": ["career", "longevity", "foreign", "job"],
+        "Rahu": ["foreign", "career", "technology"],
+        "Ketu": ["spirituality", "moksha", "health"],
+    }.items()
+}
+
+# Stable area enumeration -> bit, and planet -> bitmask of signified areas
+_AREA_BIT: Dict[str, int] = {
+    area: 1 << i
+    for i, area in enumerate(sorted(set(_AREA_HOUSES).union(*_PLANET_AREAS.values())))
+}
+_PLANET_AREA_MASK: Dict[str, int] = {
+    planet: sum(_AREA_BIT[area] for area in areas)
+    for planet, areas in _PLANET_AREAS.items()
+}
+
 
 def generate_detailed_explanation(
     area: str,
@@ -202,140 +364,131 @@ def generate_detailed_explanation(
     Returns:
         DetailedExplanation with complete reasoning
     """
-    # Convert area_result to dict if it's an object
+    candidates = _prepare_transits(transit_results)
+    return _collect_sources(area, area_result, transit_results, candidates).render()
+
+
+def _collect_sources(
+    area: str,
+    area_result,
+    transit_results: List[Dict],
+    candidates: List[Tuple[int, bool, int, int]],
+) -> ExplanationSources:
+    """Gather the raw inputs of one area's explanation from pre-classified transits."""
+    # Read score/outlook from the AreaAnalysisResult object or dict
     if hasattr(area_result, 'score'):
-        area_analysis = {
-            "score": area_result.score,
-            "outlook": area_result.overall_outlook,
-            "strengths": area_result.strengths,
-            "challenges": area_result.challenges,
-        }
+        score = area_result.score
+        outlook = area_result.overall_outlook
     else:
-        area_analysis = area_result
+        score = area_result.get("score", 0)
+        outlook = area_result.get("outlook", "Neutral")
     
-    conclusion_steps = []
     supporting_factors = []
     challenging_factors = []
-    textbook_refs = []
-    confidence_breakdown = {}
-    
-    # Step 1: Identify relevant houses for this area
-    area_houses = _get_area_houses(area)
-    conclusion_steps.append(
-        f"Step 1: Identified relevant houses for {area}: {area_houses}. "
-        f"These houses govern {_get_house_meanings(area_houses)}."
-    )
-    textbook_refs.append("BPHS Ch. 7: Houses and Their Significations")
+    confidence_pairs = []
     
-    # Step 2: Analyze each relevant planet transit
-    for transit in transit_results:
+    # Analyze each relevant planet transit
+    area_house_mask = _AREA_HOUSE_MASK.get(area, _DEFAULT_AREA_HOUSE_MASK)
+    for i, is_support in _classify_transits(area, area_house_mask, candidates):
+        transit = transit_results[i]
         planet = transit.get("planet", "")
         house = transit.get("house_from_moon", 0)
-        status = transit.get("final_status", "Neutral")
         
         # Get textbook result for this transit
-        textbook_result = TRANSIT_RESULTS_DESCRIPTIONS.get(planet, {}).get(house, {})
+        _quality, result_txt = _TRANSIT_TABLE.get((planet, house), _EMPTY_TRANSIT)
         
-        # Check if this transit affects the area
-        is_relevant = (
-            house in area_houses or
-            _planet_signifies_area(planet, area)
-        )
+        detail = {
+            "planet": planet,
+            "house": house,
+            "status": transit.get("final_status", "Neutral"),
+            "textbook_result": result_txt,
+            "reasoning": _REASONING_TEMPLATE % (planet, house, result_txt),
+        }
         
-        if is_relevant:
-            detail = {
-                "planet": planet,
-                "house": house,
-                "status": status,
-                "textbook_result": textbook_result.get("result", "mixed results"),
-                "reasoning": f"{planet} transiting {house}th house from Moon "
-                            f"indicates: {textbook_result.get('result', 'mixed results')}"
-            }
-            
-            if status == "Good":
-                supporting_factors.append(detail)
-                confidence_breakdown[f"{planet}_support"] = 0.15
-            elif status == "Bad":
-                challenging_factors.append(detail)
-                confidence_breakdown[f"{planet}_challenge"] = -0.15
+        if is_support:
+            supporting_factors.append(detail)
+            confidence_pairs.append(
+                (_SUPPORT_KEYS.get(planet) or f"{planet}_support", 0.15)
+            )
+        else:
+            challenging_factors.append(detail)
+            confidence_pairs.append(
+                (_CHALLENGE_KEYS.get(planet) or f"{planet}_challenge", -0.15)
+            )
     
-    # Step 3: Build the reasoning
-    conclusion_steps.append(
-        f"Step 2: Analyzed {len(transit_results)} planetary transits. "
-        f"Found {len(supporting_factors)} supporting and {len(challenging_factors)} challenging factors."
+    return ExplanationSources(
+        area=area,
+        area_houses=_get_area_houses(area),
+        n_transits=len(transit_results),
+        supporting_factors=supporting_factors,
+        challenging_factors=challenging_factors,
+        confidence_pairs=confidence_pairs,
+        score=score,
+        outlook=outlook,
     )
-    textbook_refs.append("BPHS Tables 53-59: Transit Results from Moon")
-    
-    # Step 4: Synthesize conclusion
-    score = area_analysis.get("score", 0)
-    outlook = area_analysis.get("outlook", "Neutral")
+
+
+def _prepare_transits(transit_results: List[Dict]) -> List[Tuple[int, bool, int, int]]:
+    """
+    Pre-classify transits independently of any area.
     
-    if score >= 20:
-        why = (
-            f"The overall score of {score:.1f} indicates favorable transits for {area}. "
-            f"This is because {len(supporting_factors)} planets are positively influencing "
-            f"the houses related to {area} ({', '.join(map(str, area_houses))}), "
-            f"while only {len(challenging_factors)} planets pose challenges."
-        )
-    elif score <= -20:
-        why = (
-            f"The overall score of {score:.1f} indicates challenging transits for {area}. "
-            f"This is because {len(challenging_factors)} planets are creating obstacles in "
-            f"the houses related to {area} ({', '.join(map(str, area_houses))}), "
-            f"outweighing the {len(supporting_factors)} supporting influences."
-        )
-    else:
-        why = (
-            f"The overall score of {score:.1f} indicates mixed transits for {area}. "
-            f"The {len(supporting_factors)} supporting factors are balanced by "
-            f"{len(challenging_factors)} challenging factors. Selective action is recommended."
-        )
+    Returns:
+        (index into transit_results, is_supporting, house bit, planet's
+        signified-area mask) for each transit with a Good or Bad status,
+        in input order
+    """
+    candidates = []
+    for i, transit in enumerate(transit_results):
+        is_support = _STATUS_IS_SUPPORT.get(transit.get("final_status"))
+        if is_support is None:
+            continue
+        candidates.append((
+            i,
+            is_support,
+            _HOUSE_BIT.get(transit.get("house_from_moon", 0), 0),
+            _PLANET_AREA_MASK.get(transit.get("planet", ""), 0),
+        ))
+    return candidates
+
+
+def _classify_transits(
+    area: str,
+    area_house_mask: int,
+    candidates: List[Tuple[int, bool, int, int]],
+) -> List[Tuple[int, bool]]:
+    """
+    Find the transits that support or challenge an area.
     
-    conclusion_steps.append(f"Step 3: Calculated weighted score: {score:.1f} → {outlook} outlook")
-    conclusion_steps.append(f"Step 4: {why}")
-    textbook_refs.append("Vedic Astrology Ch. 25: Transits and Natal References")
+    This is the scoring core of the explanation: it only tests relevance,
+    and leaves building the detail dicts and text to the caller for the
+    handful of transits that matter.
     
-    # Generate summary
-    summary = _generate_detailed_summary(area, outlook, supporting_factors, challenging_factors)
+    Args:
+        area: The life area being analyzed
+        area_house_mask: Bitmask of the area's houses
+        candidates: Output of _prepare_transits
     
-    return DetailedExplanation(
-        summary=summary,
-        conclusion_steps=conclusion_steps,
-        why_this_conclusion=why,
-        supporting_factors=supporting_factors,
-        challenging_factors=challenging_factors,
-        textbook_references=textbook_refs,
-        confidence_breakdown=confidence_breakdown,
-    )
+    Returns:
+        (index into transit_results, is_supporting) for each relevant
+        transit, in input order
+    """
+    area_bit = _AREA_BIT.get(area, 0)
+    return [
+        (i, is_support)
+        for i, is_support, house_bit, planet_area_mask in candidates
+        # Relevant if in one of the area's houses or the planet signifies it
+        if area_house_mask & house_bit | planet_area_mask & area_bit
+    ]
 
 
-def _get_area_houses(area: str) -> List[int]:
+def _get_area_houses(area: str) -> Tuple[int, ...]:
     """Get the houses relevant to an area."""
-    area_house_map = {
-        "career": [10, 6, 2],
-        "job": [6, 10, 2],
-        "business": [7, 10, 11],
-        "finance": [2, 11, 5, 9],
-        "wealth": [2, 11, 5],
-        "health": [1, 6, 8],
-        "marriage": [7, 2, 4, 11],
-        "relationships": [7, 5, 11],
-        "love": [5, 7, 11],
-        "education": [4, 5, 9],
-        "travel": [3, 9, 12],
-        "foreign": [9, 12, 7],
-        "family": [2, 4, 5],
-        "children": [5, 9, 11],
-        "spirituality": [9, 12, 5],
-        "property": [4, 2, 11],
-        "legal": [6, 9, 7],
-        "general": [1, 2, 4, 7, 10],
-    }
-    return area_house_map.get(area, [1, 2, 4, 7, 10])
-
-
-def _get_house_meanings(houses: List[int]) -> str:
-    """Get the meanings of a list of houses."""
+    return _AREA_HOUSES.get(area, _DEFAULT_AREA_HOUSES)
+
+
+@lru_cache(maxsize=64)
+def _get_house_meanings(houses: Tuple[int, ...]) -> str:
+    """Get the meanings of a tuple of houses (cached per house tuple)."""
     meanings = []
     for h in houses[:3]:  # Limit to 3 for brevity
         if h in HOUSE_AREA_MEANING:
@@ -343,20 +496,65 @@ def _get_house_meanings(houses: List[int]) -> str:
     return ", ".join(meanings)
 
 
-def _planet_signifies_area(planet: str, area: str) -> bool:
-    """Check if a planet naturally signifies an area."""
-    planet_areas = {
-        "Sun": ["career", "health", "government", "father"],
-        "Moon": ["family", "health", "travel", "mother"],
-        "Mars": ["property", "health", "legal", "siblings"],
-        "Mercury": ["education", "business", "career", "communication"],
-        "Jupiter": ["finance", "children", "education", "spirituality", "wealth"],
-        "Venus": ["marriage", "relationships", "finance", "love"],
-        "Saturn": ["career", "longevity", "foreign", "job"],
-        "Rahu": ["foreign", "career", "technology"],
-        "Ketu": ["spirituality", "moksha", "health"],
-    }
-    return area in planet_areas.get(planet, [])
+def _build_positive_summary(
+    area: str,
+    supporting: List[Dict],
+    challenging: List[Dict]
+) -> str:
+    """Summary for a Positive outlook."""
+    parts = [f"Your {area} outlook is positive based on transit analysis. "]
+    if supporting:
+        support_planets = [f["planet"] for f in supporting[:3]]
+        parts.append(
+            f"The favorable transits of {', '.join(support_planets)} "
+            f"are creating supportive conditions. "
+        )
+        parts.append(f"Specifically, {supporting[0]['reasoning']}. ")
+    parts.append("This is a good period to pursue your goals in this area.")
+    return "".join(parts)
+
+
+def _build_challenging_summary(
+    area: str,
+    supporting: List[Dict],
+    challenging: List[Dict]
+) -> str:
+    """Summary for a Challenging outlook."""
+    parts = [f"Your {area} outlook shows some challenges based on transit analysis. "]
+    if challenging:
+        challenge_planets = [f["planet"] for f in challenging[:3]]
+        parts.append(
+            f"The transits of {', '.join(challenge_planets)} "
+            f"are creating obstacles. "
+        )
+        parts.append(f"Specifically, {challenging[0]['reasoning']}. ")
+    parts.append("Patience and careful planning are recommended during this period.")
+    return "".join(parts)
+
+
+def _build_mixed_summary(
+    area: str,
+    supporting: List[Dict],
+    challenging: List[Dict]
+) -> str:
+    """Summary for a mixed/neutral outlook."""
+    parts = [f"Your {area} outlook is mixed based on transit analysis. "]
+    if supporting and challenging:
+        support_planets = [f["planet"] for f in supporting[:2]]
+        challenge_planets = [f["planet"] for f in challenging[:2]]
+        parts.append(
+            f"While {', '.join(support_planets)} provide support, "
+            f"{', '.join(challenge_planets)} create some resistance. "
+        )
+    parts.append("Selective action focusing on strengths will yield best results.")
+    return "".join(parts)
+
+
+# Outlook -> summary builder (anything else reads as mixed)
+_SUMMARY_BUILDERS = {
+    "Positive": _build_positive_summary,
+    "Challenging": _build_challenging_summary,
+}
 
 
 def _generate_detailed_summary(
@@ -366,53 +564,17 @@ def _generate_detailed_summary(
     challenging: List[Dict]
 ) -> str:
     """Generate a detailed summary paragraph."""
-    # Build supporting planets list
-    support_planets = [f["planet"] for f in supporting]
-    challenge_planets = [f["planet"] for f in challenging]
-    
-    if outlook == "Positive":
-        summary = (
-            f"Your {area} outlook is positive based on transit analysis. "
-        )
-        if support_planets:
-            summary += (
-                f"The favorable transits of {', '.join(support_planets[:3])} "
-                f"are creating supportive conditions. "
-            )
-        if supporting:
-            summary += f"Specifically, {supporting[0]['reasoning']}. "
-        summary += "This is a good period to pursue your goals in this area."
-        
-    elif outlook == "Challenging":
-        summary = (
-            f"Your {area} outlook shows some challenges based on transit analysis. "
-        )
-        if challenge_planets:
-            summary += (
-                f"The transits of {', '.join(challenge_planets[:3])} "
-                f"are creating obstacles. "
-            )
-        if challenging:
-            summary += f"Specifically, {challenging[0]['reasoning']}. "
-        summary += "Patience and careful planning are recommended during this period."
-        
-    else:
-        summary = (
-            f"Your {area} outlook is mixed based on transit analysis. "
-        )
-        if support_planets and challenge_planets:
-            summary += (
-                f"While {', '.join(support_planets[:2])} provide support, "
-                f"{', '.join(challenge_planets[:2])} create some resistance. "
-            )
-        summary += "Selective action focusing on strengths will yield best results."
-    
-    return summary
+    builder = _SUMMARY_BUILDERS.get(outlook, _build_mixed_summary)
+    return builder(area, supporting, challenging)
 
 
 def get_transit_description(planet: str, house: int) -> Dict:
     """Get the textbook description for a transit."""
-    return TRANSIT_RESULTS_DESCRIPTIONS.get(planet, {}).get(house, {
-        "quality": "Neutral",
-        "result": "Mixed results expected"
-    })
+    description = TRANSIT_RESULTS_DESCRIPTIONS.get(planet, _NO_DESCRIPTIONS).get(house)
+    if description is None:
+        # Fresh dict per miss: callers may mutate what they get back
+        return {
+            "quality": "Neutral",
+            "result": "Mixed results expected"
+        }
+    return description
@@ -11,14 +11,16 @@ Integrates ALL transit analysis layers:
 - Layer 7 (Body Parts): Health/body transit analysis
 - Layer 8 (Ashtakavarga): Bindu-based transit scoring
 """
-from typing import Dict, List, Optional, Any
+from typing import Dict, FrozenSet, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
+from bisect import bisect_right
 from datetime import datetime
+from functools import lru_cache
 
 from .rules import MOON_TRANSIT_RULES
 from .vedha import check_vedha_obstruction, get_favorable_houses
-from .taras import calculate_tara, is_favorable_tara, get_tara_strength_score
-from .murthi import get_murthi_for_transit, get_murthi_modifier
+from .taras import calculate_tara, is_favorable_tara, get_tara_strength_score, TARA_DATA
+from .murthi import get_murthi_for_transit, get_murthi_modifier, MURTHI_MODIFIERS
 from .special_nakshatras import (
     calculate_special_nakshatra,
     analyze_transit_in_special_nakshatra,
@@ -52,25 +54,132 @@ from .types import (
 )
 
 
+# Planets that have Ashtakavarga bindus (the nodes do not)
+AV_ELIGIBLE_PLANETS: FrozenSet[str] = frozenset(
+    p for p in PLANET_NAMES if p not in ("Rahu", "Ketu")
+)
+
+
 def get_sign_from_longitude(longitude: float) -> int:
     """Convert longitude to sign index (1-12)."""
     return int(longitude // 30) + 1
 
 
+# Arc of one nakshatra in degrees
+NAKSHATRA_SPAN = 360 / 27
+
+
 def get_nakshatra_from_longitude(longitude: float) -> int:
     """Convert longitude to nakshatra index (1-27)."""
-    return int(longitude // (360 / 27)) + 1
+    return int(longitude // NAKSHATRA_SPAN) + 1
 
 
 def calculate_house_from_sign(reference_sign: int, planet_sign: int) -> int:
     """Calculate house number (1-12) from reference sign."""
-    house = planet_sign - reference_sign + 1
-    if house <= 0:
-        house += 12
-    return house
+    return (planet_sign - reference_sign) % 12 + 1
+
+
+# Per-layer score contributions used by _synthesize, folded from the layer
+# rules once at import instead of re-deriving them per planet
+_BASIC_POINTS: Dict[str, int] = {"Good": 30, "Bad": -30}
+
+_SPECIAL_NAKSHATRA_POINTS: Dict[str, int] = {"favorable": 15, "unfavorable": -15}
+
+_UNFAVORABLE_TARA_POINTS = -10
+_TARA_POINTS: Dict[str, int] = {
+    tara_name: 15 if is_favorable_tara(tara_name) else _UNFAVORABLE_TARA_POINTS
+    for tara_name, _ in TARA_DATA.values()
+}
+
+
+def _murthi_points(murthi_type: str) -> int:
+    """Score contribution of a Murthi type (from its result modifier)."""
+    murthi_mod = get_murthi_modifier(murthi_type)
+    if murthi_mod >= 0.75:
+        return 10
+    if murthi_mod < 0.5:
+        return -10
+    return 0
+
+
+_MURTHI_POINTS: Dict[str, int] = {
+    murthi_type: _murthi_points(murthi_type) for murthi_type in MURTHI_MODIFIERS
+}
+_DEFAULT_MURTHI_POINTS = _murthi_points("Unknown")
+
+
+def _tara_fields(natal_nakshatra: int, transit_nakshatra: int) -> Tuple:
+    """(tara_name, tara_quality, nakshatra_distance, special_nakshatra)."""
+    tara_data = calculate_tara(natal_nakshatra, transit_nakshatra)
+    return (
+        tara_data["tara_name"],
+        tara_data["tara_quality"],
+        tara_data["nakshatra_distance"],
+        tara_data.get("special_nakshatra"),
+    )
+
+
+# Tara for every (natal, transit) nakshatra pair -- only 27 x 27 exist
+_TARA_TABLE: Dict[Tuple[int, int], Tuple] = {
+    (natal, transit): _tara_fields(natal, transit)
+    for natal in range(1, 28)
+    for transit in range(1, 28)
+}
+
+
+# Score bands for _synthesize (scores are whole points): <= -25 Bad,
+# -24..24 Neutral, >= 25 Good; |score| < 20 Low, < 40 Medium, else High
+_FINAL_STATUS_BOUNDS = (-24, 25)
+_FINAL_STATUSES = ("Bad", "Neutral", "Good")
+_CONFIDENCE_BOUNDS = (20, 40)
+_CONFIDENCES = ("Low", "Medium", "High")
+
+
+# Modifier notes raised by _synthesize, as bit flags (in display order)
+_MOD_VEDHA = 1
+_MOD_TARA = 2
+_MOD_MURTHI = 4
+_MOD_SPECIAL_NAKSHATRA = 8
+_MOD_LATTA = 16
+_MOD_ASHTAKAVARGA = 32
 
 
-@dataclass
+def _decode_modifiers(
+    mod_flags: int,
+    planet: str,
+    vedha: Tuple,
+    tara: Tuple,
+    murthi: Optional[Dict],
+    special_nak: Optional[Dict],
+    ashtakavarga: Optional[Dict],
+) -> List[str]:
+    """Format the modifier notes for the flags set by _synthesize."""
+    modifiers = []
+    if mod_flags & _MOD_VEDHA:
+        modifiers.append(f"Blocked by {vedha[1]}")
+    if mod_flags & _MOD_TARA:
+        modifiers.append(f"Weakened by {tara[0]} Tara")
+    if mod_flags & _MOD_MURTHI:
+        modifiers.append(f"Reduced by {murthi['murthi_type']} Murthi")
+    if mod_flags & _MOD_SPECIAL_NAKSHATRA:
+        modifiers.append(f"In {special_nak['name']} nakshatra (unfavorable)")
+    if mod_flags & _MOD_LATTA:
+        modifiers.append(f"{planet} has latta (kick) on birth star")
+    if mod_flags & _MOD_ASHTAKAVARGA:
+        modifiers.append(f"Low Ashtakavarga ({ashtakavarga['bav_score']} bindus)")
+    return modifiers
+
+
+# Layer 1 (BPHS foundation) flattened to (planet, house from Moon) keys
+_BASIC_RESULTS: Dict[Tuple[str, int], Tuple[str, str]] = {
+    (planet, house): (rule["status"], rule["text"])
+    for planet, rules in MOON_TRANSIT_RULES.items()
+    for house, rule in rules.items()
+}
+_NO_BASIC_RESULT: Tuple[str, str] = ("Neutral", "No specific prediction available")
+
+
+@dataclass(slots=True)
 class EnhancedTransitResult:
     """Complete enhanced transit result for a planet"""
     planet: str
@@ -113,7 +222,7 @@ class EnhancedTransitResult:
     score: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class EnhancedTransitReport:
     """Complete enhanced transit report"""
     native_data: Dict
@@ -139,6 +248,45 @@ class EnhancedTransitReport:
     area_impacts: Dict = field(default_factory=dict)
 
 
+# House-based area mapping for area impacts, as bitmasks (bit h = house h)
+_AREA_HOUSE_MASKS: Dict[str, int] = {
+    area: sum(1 << house for house in houses)
+    for area, houses in {
+        "career": [10, 6, 2],
+        "finance": [2, 11, 5],
+        "health": [1, 6, 8],
+        "relationships": [7, 5, 11],
+        "marriage": [7, 2, 4],
+        "education": [4, 5, 9],
+        "travel": [3, 9, 12],
+        "spirituality": [9, 12, 5],
+        "family": [4, 2, 5],
+        "property": [4, 2, 11],
+    }.items()
+}
+
+# Planet-area associations for area impacts
+_PLANET_AREA_SETS: Dict[str, FrozenSet[str]] = {
+    planet: frozenset(areas)
+    for planet, areas in {
+        "Sun": ["career", "health", "authority"],
+        "Moon": ["emotions", "relationships", "health"],
+        "Mars": ["career", "property", "health"],
+        "Mercury": ["education", "finance", "communication"],
+        "Jupiter": ["finance", "education", "spirituality"],
+        "Venus": ["relationships", "marriage", "finance"],
+        "Saturn": ["career", "health", "longevity"],
+        "Rahu": ["career", "travel", "technology"],
+        "Ketu": ["spirituality", "health", "liberation"],
+    }.items()
+}
+_NO_AREAS: FrozenSet[str] = frozenset()
+
+# Area score per influencing planet, by final status
+_AREA_HOUSE_POINTS: Dict[str, int] = {"Good": 10, "Bad": -10}
+_AREA_SIGNIF_POINTS: Dict[str, int] = {"Good": 5, "Bad": -5}
+
+
 class EnhancedTransitAnalyzer:
     """
     Comprehensive Transit Analyzer with all 8 layers.
@@ -165,6 +313,12 @@ class EnhancedTransitAnalyzer:
         # Ensure Lagna is in natal_positions for Ashtakavarga
         if "Lagna" not in self.natal_positions:
             self.natal_positions["Lagna"] = self.natal_lagna_sign
+        
+        # Ashtakavarga applicability, decided once for every analysis
+        self._av_enabled = bool(self.natal_positions)
+        self._av_eligible_planets = (
+            AV_ELIGIBLE_PLANETS if self._av_enabled else frozenset()
+        )
     
     def analyze_planet(
         self,
@@ -173,16 +327,24 @@ class EnhancedTransitAnalyzer:
         all_transit_houses: Dict[str, int],
         all_transit_nakshatras: Dict[str, int],
         all_transit_signs: Dict[str, int],
-        murthi_moon_sign: Optional[int] = None
+        murthi_moon_sign: Optional[int] = None,
+        latta_by_planet: Optional[Dict[str, Dict]] = None,
     ) -> EnhancedTransitResult:
-        """Analyze a single planet with all 8 layers."""
-        transit_sign = get_sign_from_longitude(transit_longitude)
-        transit_nakshatra = get_nakshatra_from_longitude(transit_longitude)
-        house_from_moon = calculate_house_from_sign(self.natal_moon_sign, transit_sign)
-        house_from_lagna = calculate_house_from_sign(self.natal_lagna_sign, transit_sign)
+        """
+        Analyze a single planet with all 8 layers.
+        
+        latta_by_planet, when given, holds the batched latta hits on the
+        birth star (see analyze_all) and replaces the per-planet check.
+        """
+        # Same arithmetic as the module helpers, inlined against the natal
+        # signs (constant for this analyzer)
+        transit_sign = int(transit_longitude // 30) + 1
+        transit_nakshatra = int(transit_longitude // NAKSHATRA_SPAN) + 1
+        house_from_moon = (transit_sign - self.natal_moon_sign) % 12 + 1
+        house_from_lagna = (transit_sign - self.natal_lagna_sign) % 12 + 1
         
         # Layer 1: BPHS Foundation
-        basic = self._get_basic_result(planet, house_from_moon)
+        basic = _BASIC_RESULTS.get((planet, house_from_moon), _NO_BASIC_RESULT)
         
         # Layer 2: Vedha
         vedha = self._analyze_vedha(planet, house_from_moon, all_transit_houses)
@@ -203,18 +365,21 @@ class EnhancedTransitAnalyzer:
         )
         
         # Layer 6: Latta (only for planets with latta rules)
-        latta_check = check_latta_on_nakshatra(
-            self.natal_moon_nakshatra,
-            {planet: transit_nakshatra}
-        )
-        latta = latta_check[0] if latta_check else None
+        if latta_by_planet is not None:
+            latta = latta_by_planet.get(planet)
+        else:
+            latta_check = check_latta_on_nakshatra(
+                self.natal_moon_nakshatra,
+                {planet: transit_nakshatra}
+            )
+            latta = latta_check[0] if latta_check else None
         
         # Layer 7: Body Parts
         body_part = None  # Calculated at report level
         
         # Layer 8: Ashtakavarga
         ashtakavarga = None
-        if self.natal_positions and planet not in ["Rahu", "Ketu"]:
+        if planet in self._av_eligible_planets:
             av_score = analyze_transit_ashtakavarga(
                 planet, transit_sign, self.natal_positions, house_from_lagna
             )
@@ -238,10 +403,19 @@ class EnhancedTransitAnalyzer:
             transit_nakshatra_name=NAKSHATRA_NAMES[transit_nakshatra],
             house_from_moon=house_from_moon,
             house_from_lagna=house_from_lagna,
-            basic_status=basic["status"],
-            basic_prediction=basic["text"],
-            vedha=vedha,
-            tara=tara,
+            basic_status=basic[0],
+            basic_prediction=basic[1],
+            vedha={
+                "is_obstructed": vedha[0],
+                "obstructing_planet": vedha[1],
+                "vedha_house": vedha[2],
+            },
+            tara={
+                "tara_name": tara[0],
+                "tara_quality": tara[1],
+                "nakshatra_distance": tara[2],
+                "special_nakshatra": tara[3],
+            },
             murthi=murthi,
             special_nakshatra=special_nak,
             latta=latta,
@@ -267,29 +441,39 @@ class EnhancedTransitAnalyzer:
         all_transit_nakshatras = {}
         all_transit_houses = {}
         
+        # Single pass with the conversions inlined (same arithmetic as
+        # get_sign_from_longitude / get_nakshatra_from_longitude /
+        # calculate_house_from_sign, without the per-planet calls)
+        moon_sign = self.natal_moon_sign
         for planet, longitude in transit_positions.items():
-            sign = get_sign_from_longitude(longitude)
-            nakshatra = get_nakshatra_from_longitude(longitude)
+            sign = int(longitude // 30) + 1
             all_transit_signs[planet] = sign
-            all_transit_nakshatras[planet] = nakshatra
-            all_transit_houses[planet] = calculate_house_from_sign(
-                self.natal_moon_sign, sign
-            )
+            all_transit_nakshatras[planet] = int(longitude // NAKSHATRA_SPAN) + 1
+            all_transit_houses[planet] = (sign - moon_sign) % 12 + 1
         
         # Analyze each planet
+        # Latta on the birth star for all planets in one call
+        latta_by_planet = {
+            hit["planet"]: hit
+            for hit in check_latta_on_nakshatra(
+                self.natal_moon_nakshatra, all_transit_nakshatras
+            )
+        }
+        
+        planets_to_analyze = [p for p in PLANET_NAMES if p in transit_positions]
         planet_results = []
-        for planet in PLANET_NAMES:
-            if planet in transit_positions:
-                murthi_moon = murthi_data.get(planet) if murthi_data else None
-                result = self.analyze_planet(
-                    planet,
-                    transit_positions[planet],
-                    all_transit_houses,
-                    all_transit_nakshatras,
-                    all_transit_signs,
-                    murthi_moon
-                )
-                planet_results.append(result)
+        for planet in planets_to_analyze:
+            murthi_moon = murthi_data.get(planet) if murthi_data else None
+            result = self.analyze_planet(
+                planet,
+                transit_positions[planet],
+                all_transit_houses,
+                all_transit_nakshatras,
+                all_transit_signs,
+                murthi_moon,
+                latta_by_planet,
+            )
+            planet_results.append(result)
         
         # Comprehensive latta analysis
         latta_analysis = analyze_latta_effects(
@@ -319,15 +503,18 @@ class EnhancedTransitAnalyzer:
         
         # Ashtakavarga summary
         ashtakavarga_summary = {}
-        if self.natal_positions:
+        if self._av_enabled:
             ashtakavarga_summary = calculate_transit_strength_summary(
                 all_transit_signs, self.natal_positions
             )
         
         # Categorize
-        favorable = [r.planet for r in planet_results if r.final_status == "Good"]
-        unfavorable = [r.planet for r in planet_results if r.final_status == "Bad"]
-        obstructed = [r.planet for r in planet_results if r.final_status == "Obstructed"]
+        favorable, unfavorable, obstructed = [], [], []
+        by_status = {"Good": favorable, "Bad": unfavorable, "Obstructed": obstructed}
+        for r in planet_results:
+            bucket = by_status.get(r.final_status)
+            if bucket is not None:
+                bucket.append(r.planet)
         
         # Calculate overall summary
         overall_summary = self._calculate_overall_summary(
@@ -362,34 +549,35 @@ class EnhancedTransitAnalyzer:
             area_impacts=area_impacts,
         )
     
-    def _get_basic_result(self, planet: str, house: int) -> Dict[str, str]:
-        """Get BPHS foundation result."""
-        if planet in MOON_TRANSIT_RULES and house in MOON_TRANSIT_RULES[planet]:
-            return MOON_TRANSIT_RULES[planet][house]
-        return {"status": "Neutral", "text": "No specific prediction available"}
+    def analyze_range(
+        self,
+        transit_positions_by_date: Dict[str, Dict[str, float]],
+        murthi_data: Optional[Dict[str, int]] = None,
+    ) -> Dict[str, EnhancedTransitReport]:
+        """
+        Analyze a series of dates (timelines, calendars) with one analyzer.
+        
+        Returns a report per date, in the order given. The natal state and
+        the memoized per-layer lookups are shared across all dates.
+        """
+        analyze_all = self.analyze_all
+        return {
+            transit_date: analyze_all(transit_positions, transit_date, murthi_data)
+            for transit_date, transit_positions in transit_positions_by_date.items()
+        }
     
     def _analyze_vedha(
         self, planet: str, house: int, all_houses: Dict[str, int]
-    ) -> Dict:
-        """Analyze Vedha."""
-        is_obstructed, obstructor, vedha_house = check_vedha_obstruction(
-            planet, house, all_houses
-        )
-        return {
-            "is_obstructed": is_obstructed,
-            "obstructing_planet": obstructor,
-            "vedha_house": vedha_house,
-        }
+    ) -> Tuple:
+        """Analyze Vedha: (is_obstructed, obstructing_planet, vedha_house)."""
+        return check_vedha_obstruction(planet, house, all_houses)
     
-    def _analyze_tara(self, transit_nakshatra: int) -> Dict:
-        """Analyze Tara."""
-        tara_data = calculate_tara(self.natal_moon_nakshatra, transit_nakshatra)
-        return {
-            "tara_name": tara_data["tara_name"],
-            "tara_quality": tara_data["tara_quality"],
-            "nakshatra_distance": tara_data["nakshatra_distance"],
-            "special_nakshatra": tara_data.get("special_nakshatra"),
-        }
+    def _analyze_tara(self, transit_nakshatra: int) -> Tuple:
+        """Analyze Tara: (tara_name, tara_quality, nakshatra_distance, special_nakshatra)."""
+        fields = _TARA_TABLE.get((self.natal_moon_nakshatra, transit_nakshatra))
+        if fields is None:
+            fields = _tara_fields(self.natal_moon_nakshatra, transit_nakshatra)
+        return fields
     
     def _analyze_murthi(self, moon_sign_at_entry: int) -> Dict:
         """Analyze Murthi."""
@@ -405,63 +593,56 @@ class EnhancedTransitAnalyzer:
     def _synthesize(
         self,
         planet: str,
-        basic: Dict,
-        vedha: Dict,
-        tara: Dict,
+        basic: Tuple[str, str],
+        vedha: Tuple,
+        tara: Tuple,
         murthi: Optional[Dict],
         special_nak: Optional[Dict],
         latta: Optional[Dict],
         ashtakavarga: Optional[Dict],
     ) -> tuple:
         """Synthesize all layers into final result."""
-        basic_status = basic["status"]
-        basic_text = basic["text"]
+        basic_status, basic_text = basic
         
-        # Scoring system (-100 to +100)
-        score = 0
-        modifiers = []
+        # Scoring system (-100 to +100); modifier notes are flagged here and
+        # only formatted when at least one applies
+        mod_flags = 0
         
-        # Basic status score
-        if basic_status == "Good":
-            score += 30
-        elif basic_status == "Bad":
-            score -= 30
+        # Basic status score (positive only for a "Good" foundation)
+        basic_points = _BASIC_POINTS.get(basic_status, 0)
+        score = basic_points
         
         # Vedha impact
-        if vedha["is_obstructed"] and basic_status == "Good":
+        blocked = basic_points > 0 and vedha[0]
+        if blocked:
             score -= 25
-            modifiers.append(f"Blocked by {vedha['obstructing_planet']}")
+            mod_flags |= _MOD_VEDHA
         
         # Tara impact
-        tara_favorable = is_favorable_tara(tara["tara_name"])
-        if tara_favorable:
-            score += 15
-        else:
-            score -= 10
-            if tara["tara_quality"] == "Bad":
-                modifiers.append(f"Weakened by {tara['tara_name']} Tara")
+        tara_name, tara_quality = tara[0], tara[1]
+        tara_points = _TARA_POINTS.get(tara_name, _UNFAVORABLE_TARA_POINTS)
+        score += tara_points
+        if tara_points < 0 and tara_quality == "Bad":
+            mod_flags |= _MOD_TARA
         
         # Murthi impact
         if murthi:
-            murthi_mod = get_murthi_modifier(murthi["murthi_type"])
-            if murthi_mod >= 0.75:
-                score += 10
-            elif murthi_mod < 0.5:
-                score -= 10
-                modifiers.append(f"Reduced by {murthi['murthi_type']} Murthi")
+            murthi_points = _MURTHI_POINTS.get(murthi["murthi_type"], _DEFAULT_MURTHI_POINTS)
+            score += murthi_points
+            if murthi_points < 0:
+                mod_flags |= _MOD_MURTHI
         
         # Special Nakshatra impact
         if special_nak and special_nak.get("is_special"):
-            if special_nak.get("quality") == "favorable":
-                score += 15
-            elif special_nak.get("quality") == "unfavorable":
-                score -= 15
-                modifiers.append(f"In {special_nak['name']} nakshatra (unfavorable)")
+            special_points = _SPECIAL_NAKSHATRA_POINTS.get(special_nak.get("quality"), 0)
+            score += special_points
+            if special_points < 0:
+                mod_flags |= _MOD_SPECIAL_NAKSHATRA
         
         # Latta impact
         if latta:
             score -= 20
-            modifiers.append(f"{planet} has latta (kick) on birth star")
+            mod_flags |= _MOD_LATTA
         
         # Ashtakavarga impact
         if ashtakavarga:
@@ -470,28 +651,22 @@ class EnhancedTransitAnalyzer:
                 score += 15
             elif bav < 3:
                 score -= 15
-                modifiers.append(f"Low Ashtakavarga ({bav} bindus)")
+                mod_flags |= _MOD_ASHTAKAVARGA
         
         # Determine final status
-        if vedha["is_obstructed"] and basic_status == "Good":
+        if blocked:
             final_status = "Obstructed"
-        elif score >= 25:
-            final_status = "Good"
-        elif score <= -25:
-            final_status = "Bad"
         else:
-            final_status = "Neutral"
+            final_status = _FINAL_STATUSES[bisect_right(_FINAL_STATUS_BOUNDS, score)]
         
         # Confidence
-        if abs(score) >= 40:
-            confidence = "High"
-        elif abs(score) >= 20:
-            confidence = "Medium"
-        else:
-            confidence = "Low"
+        confidence = _CONFIDENCES[bisect_right(_CONFIDENCE_BOUNDS, abs(score))]
         
         # Final prediction
-        if modifiers:
+        if mod_flags:
+            modifiers = _decode_modifiers(
+                mod_flags, planet, vedha, tara, murthi, special_nak, ashtakavarga
+            )
             final_prediction = f"{basic_text}. Note: {'; '.join(modifiers)}."
         else:
             final_prediction = basic_text
@@ -505,12 +680,18 @@ class EnhancedTransitAnalyzer:
         ashtakavarga_summary: Dict,
     ) -> Dict:
         """Calculate overall transit period summary."""
-        total_score = sum(r.score for r in results)
+        # One pass for the score total and the Good/Bad counts
+        total_score = 0
+        good_count = bad_count = 0
+        for r in results:
+            total_score += r.score
+            status = r.final_status
+            if status == "Good":
+                good_count += 1
+            elif status == "Bad":
+                bad_count += 1
         avg_score = total_score / len(results) if results else 0
         
-        good_count = len([r for r in results if r.final_status == "Good"])
-        bad_count = len([r for r in results if r.final_status == "Bad"])
-        
         # Overall assessment
         if avg_score >= 15:
             assessment = "Favorable Period"
@@ -546,46 +727,22 @@ class EnhancedTransitAnalyzer:
         special_nak_analysis: Dict,
     ) -> Dict:
         """Calculate impacts on different life areas."""
-        # House-based area mapping
-        area_house_map = {
-            "career": [10, 6, 2],
-            "finance": [2, 11, 5],
-            "health": [1, 6, 8],
-            "relationships": [7, 5, 11],
-            "marriage": [7, 2, 4],
-            "education": [4, 5, 9],
-            "travel": [3, 9, 12],
-            "spirituality": [9, 12, 5],
-            "family": [4, 2, 5],
-            "property": [4, 2, 11],
-        }
-        
-        # Planet-area associations
-        planet_areas = {
-            "Sun": ["career", "health", "authority"],
-            "Moon": ["emotions", "relationships", "health"],
-            "Mars": ["career", "property", "health"],
-            "Mercury": ["education", "finance", "communication"],
-            "Jupiter": ["finance", "education", "spirituality"],
-            "Venus": ["relationships", "marriage", "finance"],
-            "Saturn": ["career", "health", "longevity"],
-            "Rahu": ["career", "travel", "technology"],
-            "Ketu": ["spirituality", "health", "liberation"],
-        }
+        # House bits (from Moon and from Lagna) per result, computed once
+        result_bits = [
+            (result, (1 << result.house_from_lagna) | (1 << result.house_from_moon))
+            for result in results
+        ]
         
         area_impacts = {}
         
-        for area, houses in area_house_map.items():
+        for area, area_mask in _AREA_HOUSE_MASKS.items():
             score = 0
             influencing_planets = []
             
-            for result in results:
+            for result, house_bits in result_bits:
                 # House influence
-                if result.house_from_lagna in houses or result.house_from_moon in houses:
-                    if result.final_status == "Good":
-                        score += 10
-                    elif result.final_status == "Bad":
-                        score -= 10
+                if area_mask & house_bits:
+                    score += _AREA_HOUSE_POINTS.get(result.final_status, 0)
                     influencing_planets.append({
                         "planet": result.planet,
                         "status": result.final_status,
@@ -593,11 +750,8 @@ class EnhancedTransitAnalyzer:
                     })
                 
                 # Planet signification influence
-                if area in planet_areas.get(result.planet, []):
-                    if result.final_status == "Good":
-                        score += 5
-                    elif result.final_status == "Bad":
-                        score -= 5
+                if area in _PLANET_AREA_SETS.get(result.planet, _NO_AREAS):
+                    score += _AREA_SIGNIF_POINTS.get(result.final_status, 0)
             
             # Determine area outlook
             if score >= 15:
@@ -616,6 +770,36 @@ class EnhancedTransitAnalyzer:
         return area_impacts
 
 
+@lru_cache(maxsize=64)
+def _get_analyzer(
+    natal_moon_sign: int,
+    natal_moon_nakshatra: int,
+    natal_moon_longitude: float,
+    natal_lagna_sign: int,
+    natal_lagna_nakshatra: int,
+    natal_key: Tuple[Tuple[str, int], ...],
+) -> EnhancedTransitAnalyzer:
+    """Get the (shared) analyzer for a native, keyed by its natal data."""
+    return EnhancedTransitAnalyzer(
+        natal_moon_sign=natal_moon_sign,
+        natal_moon_nakshatra=natal_moon_nakshatra,
+        natal_moon_longitude=natal_moon_longitude,
+        natal_lagna_sign=natal_lagna_sign,
+        natal_lagna_nakshatra=natal_lagna_nakshatra,
+        natal_positions=dict(natal_key),
+    )
+
+
+@lru_cache(maxsize=256)
+def _cached_report(
+    analyzer: EnhancedTransitAnalyzer,
+    transit_key: Tuple[Tuple[str, float], ...],
+    transit_date: str,
+) -> EnhancedTransitReport:
+    """Analyze one set of transit positions for a date, memoized."""
+    return analyzer.analyze_all(dict(transit_key), transit_date)
+
+
 def create_enhanced_transit_report(
     natal_moon_sign: int,
     natal_moon_nakshatra: int,
@@ -629,15 +813,22 @@ def create_enhanced_transit_report(
     """
     Create comprehensive enhanced transit report.
     
-    Main entry point for enhanced transit analysis.
+    Main entry point for enhanced transit analysis. Analyzers are cached
+    per native and reports per (native, transit positions, date), so the
+    returned report may be shared and must be treated as read-only.
     """
-    analyzer = EnhancedTransitAnalyzer(
-        natal_moon_sign=natal_moon_sign,
-        natal_moon_nakshatra=natal_moon_nakshatra,
-        natal_moon_longitude=natal_moon_longitude,
-        natal_lagna_sign=natal_lagna_sign,
-        natal_lagna_nakshatra=natal_lagna_nakshatra,
-        natal_positions=natal_positions,
+    if transit_date is None:
+        transit_date = datetime.now().strftime("%Y-%m-%d")
+    
+    analyzer = _get_analyzer(
+        natal_moon_sign,
+        natal_moon_nakshatra,
+        natal_moon_longitude,
+        natal_lagna_sign,
+        natal_lagna_nakshatra,
+        tuple(sorted(natal_positions.items())),
     )
     
-    return analyzer.analyze_all(transit_positions, transit_date)
+    return _cached_report(
+        analyzer, tuple(transit_positions.items()), transit_date
+    )
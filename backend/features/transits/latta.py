@@ -9,8 +9,9 @@ constellation based on its transit position. If a transit planet has latta on
 the constellation occupied by Moon (or lagna) in natal chart, then we may expect 
 some unfavorable results related to the signification of the planet in natal chart.
 """
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple, TypedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from enum import Enum
 
 
@@ -20,7 +21,7 @@ class LattaDirection(str, Enum):
     BACKWARD = "backward"  # Prishtha latta - backward kick
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LattaRule:
     """Rule for planetary kick calculation"""
     planet: str
@@ -29,6 +30,34 @@ class LattaRule:
     description: str
 
 
+class _LattaHitBase(TypedDict):
+    """Keys present on every latta hit"""
+    planet: str
+    transit_nakshatra: str
+    transit_nakshatra_index: int
+    latta_on: str
+    direction: str
+    offset: int
+
+
+class LattaHit(_LattaHitBase, total=False):
+    """A planet having latta on a target nakshatra"""
+    # Added by analyze_latta_effects
+    effect: str
+    importance: str
+    house_effect: str
+
+
+class LattaAnalysis(TypedDict):
+    """Result of analyze_latta_effects"""
+    latta_on_janma: List[LattaHit]
+    latta_on_lagna: List[LattaHit]
+    overall_latta_count: int
+    severity: str
+    affected_areas: List[str]
+    interpretation: str
+
+
 # Latta rules from Section 26.7
 LATTA_RULES: Dict[str, LattaRule] = {
     # Forward kicks (Purolatta)
@@ -84,6 +113,41 @@ LATTA_RULES: Dict[str, LattaRule] = {
     ),
 }
 
+# Nakshatras counted from the transit position to the latta target, signed by
+# direction: forward kicks count ahead, backward kicks count behind
+LATTA_SIGNED_OFFSET: Dict[str, int] = {
+    planet: (rule.offset - 1) if rule.direction == LattaDirection.FORWARD
+    else -(rule.offset - 1)
+    for planet, rule in LATTA_RULES.items()
+}
+
+# Latta target for every (planet, transit nakshatra 1-27), indexed by nakshatra - 1
+_LATTA_TABLE: Dict[str, Tuple[int, ...]] = {
+    planet: tuple((nak - 1 + signed_offset) % 27 + 1 for nak in range(1, 28))
+    for planet, signed_offset in LATTA_SIGNED_OFFSET.items()
+}
+
+# Flat (offset, direction value, description) per planet for the result
+# builders; LATTA_RULES stays the public, documented form
+_RULE_FIELDS: Dict[str, Tuple[int, str, str]] = {
+    planet: (rule.offset, rule.direction.value, rule.description)
+    for planet, rule in LATTA_RULES.items()
+}
+
+# Per-planet latta hit with the rule fields filled in; the per-hit fields are
+# placeholders so copies keep the documented key order
+_LATTA_HIT_PROTOTYPES: Dict[str, Dict] = {
+    planet: {
+        "planet": planet,
+        "transit_nakshatra": None,
+        "transit_nakshatra_index": None,
+        "latta_on": None,
+        "direction": direction,
+        "offset": offset,
+    }
+    for planet, (offset, direction, _) in _RULE_FIELDS.items()
+}
+
 # Nakshatra list for reference
 NAKSHATRA_LIST = [
     "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra",
@@ -94,6 +158,13 @@ NAKSHATRA_LIST = [
 ]
 
 
+# Reverse lookups: nakshatra name (exact / lowercased) -> 1-based index
+_NAKSHATRA_INDEX: Dict[str, int] = {nak: i + 1 for i, nak in enumerate(NAKSHATRA_LIST)}
+_NAKSHATRA_INDEX_LOWER: Dict[str, int] = {
+    nak.lower(): i + 1 for i, nak in enumerate(NAKSHATRA_LIST)
+}
+
+
 def get_nakshatra_name(index: int) -> str:
     """Get nakshatra name from 1-based index"""
     if 1 <= index <= 27:
@@ -103,13 +174,17 @@ def get_nakshatra_name(index: int) -> str:
 
 def get_nakshatra_index(name: str) -> int:
     """Get 1-based index from nakshatra name"""
-    try:
-        return NAKSHATRA_LIST.index(name) + 1
-    except ValueError:
-        for i, nak in enumerate(NAKSHATRA_LIST):
-            if name.lower() in nak.lower() or nak.lower() in name.lower():
-                return i + 1
-        return 0
+    index = _NAKSHATRA_INDEX.get(name) or _NAKSHATRA_INDEX_LOWER.get(name.lower())
+    if index:
+        return index
+    
+    # Partial match (e.g. "Purva" or "Mula nakshatra")
+    name_lower = name.lower()
+    for i, nak in enumerate(NAKSHATRA_LIST):
+        nak_lower = nak.lower()
+        if name_lower in nak_lower or nak_lower in name_lower:
+            return i + 1
+    return 0
 
 
 def calculate_latta_nakshatra(planet: str, transit_nakshatra: int) -> Optional[int]:
@@ -123,25 +198,72 @@ def calculate_latta_nakshatra(planet: str, transit_nakshatra: int) -> Optional[i
     Returns:
         Nakshatra index (1-27) that has latta from this planet, or None if no rule
     """
-    if planet not in LATTA_RULES:
+    targets = _LATTA_TABLE.get(planet)
+    if targets is None:
         return None
+    if 1 <= transit_nakshatra <= 27:
+        return targets[transit_nakshatra - 1]
     
-    rule = LATTA_RULES[planet]
+    # Out-of-range input wraps around the 27-nakshatra cycle
+    return (transit_nakshatra - 1 + LATTA_SIGNED_OFFSET[planet]) % 27 + 1
+
+
+def compute_latta_targets(
+    planet_nakshatras: Dict[str, int]
+) -> Tuple[Dict[str, int], Dict[int, List[str]]]:
+    """
+    Compute every planet's latta target in one pass.
     
-    if rule.direction == LattaDirection.FORWARD:
-        # Forward kick: count forward from transit position
-        latta_nak = ((transit_nakshatra - 1) + (rule.offset - 1)) % 27 + 1
-    else:
-        # Backward kick: count backward from transit position
-        latta_nak = ((transit_nakshatra - 1) - (rule.offset - 1)) % 27 + 1
+    Args:
+        planet_nakshatras: Dict of planet name to their current nakshatra
     
-    return latta_nak
+    Returns:
+        (planet -> latta nakshatra, latta nakshatra -> planets kicking it),
+        skipping planets without a latta rule (e.g. Ketu)
+    """
+    per_planet = {}
+    by_target = {}
+    
+    for planet, transit_nak in planet_nakshatras.items():
+        targets = _LATTA_TABLE.get(planet)
+        if targets is None:
+            continue  # No latta rule (e.g. Ketu)
+        if 1 <= transit_nak <= 27:
+            latta_nak = targets[transit_nak - 1]
+        else:
+            latta_nak = calculate_latta_nakshatra(planet, transit_nak)
+        per_planet[planet] = latta_nak
+        by_target.setdefault(latta_nak, []).append(planet)
+    
+    return per_planet, by_target
+
+
+def _latta_hits(
+    target_nakshatra: int,
+    planets: List[str],
+    planet_nakshatras: Dict[str, int]
+) -> List[LattaHit]:
+    """Build the latta result entries for planets kicking a target nakshatra"""
+    # Targets come from _LATTA_TABLE or the % 27 fallback, so they are always
+    # 1-27; the transit index may not be
+    latta_on = NAKSHATRA_LIST[target_nakshatra - 1] if planets else None
+    latta_results = []
+    
+    for planet in planets:
+        transit_nak = planet_nakshatras[planet]
+        hit = _LATTA_HIT_PROTOTYPES[planet].copy()
+        hit["transit_nakshatra"] = get_nakshatra_name(transit_nak)
+        hit["transit_nakshatra_index"] = transit_nak
+        hit["latta_on"] = latta_on
+        latta_results.append(hit)
+    
+    return latta_results
 
 
 def check_latta_on_nakshatra(
     target_nakshatra: int,
     planet_nakshatras: Dict[str, int]
-) -> List[Dict]:
+) -> List[LattaHit]:
     """
     Check which planets have latta (kick) on a target nakshatra.
     
@@ -152,26 +274,53 @@ def check_latta_on_nakshatra(
     Returns:
         List of planets having latta on the target nakshatra
     """
-    latta_results = []
+    kicking_planets = []
     
     for planet, transit_nak in planet_nakshatras.items():
-        if planet == "Ketu":
-            continue  # Ketu doesn't have latta rule
-        
-        latta_nak = calculate_latta_nakshatra(planet, transit_nak)
-        
+        targets = _LATTA_TABLE.get(planet)
+        if targets is None:
+            continue  # No latta rule (e.g. Ketu)
+        if 1 <= transit_nak <= 27:
+            latta_nak = targets[transit_nak - 1]
+        else:
+            latta_nak = calculate_latta_nakshatra(planet, transit_nak)
         if latta_nak == target_nakshatra:
-            rule = LATTA_RULES.get(planet)
-            latta_results.append({
-                "planet": planet,
-                "transit_nakshatra": get_nakshatra_name(transit_nak),
-                "transit_nakshatra_index": transit_nak,
-                "latta_on": get_nakshatra_name(target_nakshatra),
-                "direction": rule.direction.value if rule else None,
-                "offset": rule.offset if rule else None,
-            })
+            kicking_planets.append(planet)
     
-    return latta_results
+    return _latta_hits(target_nakshatra, kicking_planets, planet_nakshatras)
+
+
+# Areas of life a planet's latta affects
+PLANET_SIGNIFICATIONS: Dict[str, FrozenSet[str]] = {
+    "Sun": frozenset(["authority", "father", "career", "health", "government"]),
+    "Moon": frozenset(["mind", "mother", "emotions", "public image"]),
+    "Mars": frozenset(["siblings", "courage", "property", "accidents", "litigation"]),
+    "Mercury": frozenset(["communication", "business", "education", "skin"]),
+    "Jupiter": frozenset(["wisdom", "children", "fortune", "teachers", "legal matters"]),
+    "Venus": frozenset(["marriage", "relationships", "vehicles", "arts", "luxury"]),
+    "Saturn": frozenset(["longevity", "career", "delays", "chronic issues", "servants"]),
+    "Rahu": frozenset(["foreign matters", "unconventional", "sudden events", "technology"]),
+}
+_NO_SIGNIFICATIONS: FrozenSet[str] = frozenset()
+
+# (severity, interpretation) by number of active lattas: 0, 1, 2, 3+
+_LATTA_SEVERITY: Tuple[Tuple[str, str], ...] = (
+    ("None", "No planetary kicks active. Period is relatively smooth."),
+    ("Mild", "One planetary kick active. Minor challenges possible."),
+    ("Moderate", "Multiple planetary kicks active. Exercise caution."),
+    ("Significant", "Several planetary kicks active. Period requires careful handling."),
+)
+
+# analyze_latta_effects result when no planet kicks janma or lagna star
+# (the list values are filled in fresh per call)
+_NO_LATTA_RESULT: Dict = {
+    "latta_on_janma": None,
+    "latta_on_lagna": None,
+    "overall_latta_count": 0,
+    "severity": _LATTA_SEVERITY[0][0],
+    "affected_areas": None,
+    "interpretation": _LATTA_SEVERITY[0][1],
+}
 
 
 def analyze_latta_effects(
@@ -179,7 +328,7 @@ def analyze_latta_effects(
     lagna_nakshatra: int,
     planet_nakshatras: Dict[str, int],
     natal_house_lords: Dict[str, int] = None
-) -> Dict:
+) -> LattaAnalysis:
     """
     Comprehensive latta analysis for a native.
     
@@ -192,6 +341,18 @@ def analyze_latta_effects(
     Returns:
         Complete latta analysis with effects
     """
+    # Latta targets for all planets, computed once for both checks
+    _, by_target = compute_latta_targets(planet_nakshatras)
+    
+    # Common case: nothing kicks either star
+    if janma_nakshatra not in by_target and lagna_nakshatra not in by_target:
+        return {
+            **_NO_LATTA_RESULT,
+            "latta_on_janma": [],
+            "latta_on_lagna": [],
+            "affected_areas": [],
+        }
+    
     result = {
         "latta_on_janma": [],
         "latta_on_lagna": [],
@@ -202,48 +363,28 @@ def analyze_latta_effects(
     }
     
     # Check latta on janma nakshatra (more important)
-    janma_lattas = check_latta_on_nakshatra(janma_nakshatra, planet_nakshatras)
+    janma_lattas = _latta_hits(
+        janma_nakshatra, by_target.get(janma_nakshatra, []), planet_nakshatras
+    )
     result["latta_on_janma"] = janma_lattas
     
     # Check latta on lagna nakshatra
-    lagna_lattas = check_latta_on_nakshatra(lagna_nakshatra, planet_nakshatras)
+    lagna_lattas = _latta_hits(
+        lagna_nakshatra, by_target.get(lagna_nakshatra, []), planet_nakshatras
+    )
     result["latta_on_lagna"] = lagna_lattas
     
     total_lattas = len(janma_lattas) + len(lagna_lattas)
     result["overall_latta_count"] = total_lattas
     
     # Determine severity
-    if total_lattas == 0:
-        result["severity"] = "None"
-        result["interpretation"] = "No planetary kicks active. Period is relatively smooth."
-    elif total_lattas == 1:
-        result["severity"] = "Mild"
-        result["interpretation"] = "One planetary kick active. Minor challenges possible."
-    elif total_lattas == 2:
-        result["severity"] = "Moderate"
-        result["interpretation"] = "Multiple planetary kicks active. Exercise caution."
-    else:
-        result["severity"] = "Significant"
-        result["interpretation"] = "Several planetary kicks active. Period requires careful handling."
+    result["severity"], result["interpretation"] = _LATTA_SEVERITY[min(total_lattas, 3)]
     
     # Identify affected areas based on planets
     affected_areas = set()
     
-    planet_significations = {
-        "Sun": ["authority", "father", "career", "health", "government"],
-        "Moon": ["mind", "mother", "emotions", "public image"],
-        "Mars": ["siblings", "courage", "property", "accidents", "litigation"],
-        "Mercury": ["communication", "business", "education", "skin"],
-        "Jupiter": ["wisdom", "children", "fortune", "teachers", "legal matters"],
-        "Venus": ["marriage", "relationships", "vehicles", "arts", "luxury"],
-        "Saturn": ["longevity", "career", "delays", "chronic issues", "servants"],
-        "Rahu": ["foreign matters", "unconventional", "sudden events", "technology"],
-    }
-    
     for latta in janma_lattas + lagna_lattas:
-        planet = latta["planet"]
-        if planet in planet_significations:
-            affected_areas.update(planet_significations[planet])
+        affected_areas |= PLANET_SIGNIFICATIONS.get(latta["planet"], _NO_SIGNIFICATIONS)
     
     result["affected_areas"] = list(affected_areas)
     
@@ -277,25 +418,85 @@ def get_latta_for_all_planets(planet_nakshatras: Dict[str, int]) -> Dict[str, Di
     """
     result = {}
     
-    for planet, transit_nak in planet_nakshatras.items():
-        if planet == "Ketu":
-            continue
-        
-        latta_nak = calculate_latta_nakshatra(planet, transit_nak)
-        
-        if latta_nak:
-            rule = LATTA_RULES.get(planet)
-            result[planet] = {
-                "transit_nakshatra": get_nakshatra_name(transit_nak),
-                "latta_on_nakshatra": get_nakshatra_name(latta_nak),
-                "latta_nakshatra_index": latta_nak,
-                "direction": rule.direction.value if rule else None,
-                "description": rule.description if rule else None,
-            }
+    # Only planets with a latta rule (never Ketu), in input order. Targets are
+    # always 1-27 (see calculate_latta_nakshatra), so they index NAKSHATRA_LIST
+    # directly.
+    per_planet, _ = compute_latta_targets(planet_nakshatras)
+    
+    for planet, latta_nak in per_planet.items():
+        _, direction, description = _RULE_FIELDS[planet]
+        result[planet] = {
+            "transit_nakshatra": get_nakshatra_name(planet_nakshatras[planet]),
+            "latta_on_nakshatra": NAKSHATRA_LIST[latta_nak - 1],
+            "latta_nakshatra_index": latta_nak,
+            "direction": direction,
+            "description": description,
+        }
     
     return result
 
 
+def scan_latta_on_nakshatra(
+    target_nakshatra: int,
+    planet_nakshatras_by_date: Dict[str, Dict[str, int]]
+) -> Dict[str, List[str]]:
+    """
+    Find, for each date, the planets having latta on a target nakshatra.
+    
+    Meant for day-by-day transit scans: each planet gets the same target
+    check as check_latta_on_nakshatra, without building the hit details.
+    
+    Args:
+        target_nakshatra: The nakshatra to check for latta (e.g., janma nakshatra)
+        planet_nakshatras_by_date: Date -> dict of planet name to its nakshatra
+    
+    Returns:
+        Date -> planets having latta on the target (in input order)
+    """
+    return {
+        date: [
+            planet for planet, transit_nak in planet_nakshatras.items()
+            if calculate_latta_nakshatra(planet, transit_nak) == target_nakshatra
+        ]
+        for date, planet_nakshatras in planet_nakshatras_by_date.items()
+    }
+
+
+def count_lattas_by_date(
+    janma_nakshatra: int,
+    lagna_nakshatra: int,
+    planet_nakshatras_by_date: Dict[str, Dict[str, int]]
+) -> Dict[str, int]:
+    """
+    Count active lattas on janma and lagna nakshatras for each date.
+    
+    The count matches analyze_latta_effects' overall_latta_count, without
+    building the per-latta details -- useful for finding the days worth a
+    full analysis in ephemeris-wide scans.
+    
+    Args:
+        janma_nakshatra: Birth star nakshatra (1-27)
+        lagna_nakshatra: Lagna nakshatra (1-27)
+        planet_nakshatras_by_date: Date -> dict of planet name to its nakshatra
+    
+    Returns:
+        Date -> number of lattas on janma plus lagna nakshatra
+    """
+    counts = {}
+    for date, planet_nakshatras in planet_nakshatras_by_date.items():
+        count = 0
+        for planet, transit_nak in planet_nakshatras.items():
+            # Same per-planet target as analyze_latta_effects, so out-of-range
+            # nakshatras are counted the same way
+            latta_nak = calculate_latta_nakshatra(planet, transit_nak)
+            if latta_nak == janma_nakshatra:
+                count += 1
+            if latta_nak == lagna_nakshatra:
+                count += 1
+        counts[date] = count
+    return counts
+
+
 # House significations for latta effect interpretation
 HOUSE_SIGNIFICATIONS = {
     1: "self, body, personality, health",
@@ -313,6 +514,7 @@ HOUSE_SIGNIFICATIONS = {
 }
 
 
+@lru_cache(maxsize=128)
 def interpret_latta_by_house_lord(planet: str, house: int) -> str:
     """Generate interpretation when a house lord has latta on natal nakshatra"""
     signif = HOUSE_SIGNIFICATIONS.get(house, "")
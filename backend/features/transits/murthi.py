@@ -7,7 +7,15 @@ the "Murthi" (form) quality of that transit for an individual.
 
 This is an advanced technique that modifies the intensity of transit results.
 """
-from typing import Dict, Tuple
+from typing import Dict, Tuple, TypedDict
+
+
+class MurthiTransit(TypedDict):
+    """Murthi of a planet's transit, as returned by get_murthi_for_transit"""
+    murthi_type: str
+    moon_house_at_entry: int
+    result_quality: str
+
 
 # Murthi classifications based on Moon's house from natal Moon at rasi entry
 # Format: { murthi_name: (house_list, quality_description) }
@@ -24,6 +32,11 @@ for murthi, (houses, _) in MURTHI_DATA.items():
     for house in houses:
         HOUSE_TO_MURTHI[house] = murthi
 
+# Quality lookup: murthi -> result quality
+MURTHI_QUALITY: Dict[str, str] = {
+    murthi: quality for murthi, (_, quality) in MURTHI_DATA.items()
+}
+
 # Result modifiers for each Murthi type
 MURTHI_MODIFIERS: Dict[str, float] = {
     "Swarna": 1.0,   # Full results (100%)
@@ -32,6 +45,37 @@ MURTHI_MODIFIERS: Dict[str, float] = {
     "Loha": 0.25,    # Quarter results (25%) - highly unfavorable
 }
 
+# Human-readable descriptions for each Murthi type
+MURTHI_DESCRIPTIONS: Dict[str, str] = {
+    "Swarna": "Golden Form (Swarna Murthi) - The planet bestows its full positive results. "
+              "This is the most auspicious form for transit.",
+    "Rajata": "Silver Form (Rajata Murthi) - The planet gives good results, "
+              "approximately 3/4 of its potential.",
+    "Taamra": "Copper Form (Taamra Murthi) - The planet's results are mixed or reduced. "
+              "Only about half the expected results manifest.",
+    "Loha": "Iron Form (Loha Murthi) - The planet's positive results are severely restricted. "
+            "Even favorable transits may not yield expected benefits.",
+}
+
+
+def _calculate_house_from_moon_arith(natal_moon_sign: int, transit_moon_sign: int) -> int:
+    """House of transit Moon from natal Moon, computed (see calculate_house_from_moon)."""
+    # Both signs are 1-12, so one wrap in either direction is enough
+    house = transit_moon_sign - natal_moon_sign + 1
+    if house <= 0:
+        house += 12
+    elif house > 12:
+        house -= 12
+    return house
+
+
+# House from natal Moon for every (natal, transit) sign pair,
+# indexed [natal - 1][transit - 1]
+_HOUSE_TABLE: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(_calculate_house_from_moon_arith(natal, transit) for transit in range(1, 13))
+    for natal in range(1, 13)
+)
+
 
 def calculate_house_from_moon(natal_moon_sign: int, transit_moon_sign: int) -> int:
     """
@@ -45,16 +89,30 @@ def calculate_house_from_moon(natal_moon_sign: int, transit_moon_sign: int) -> i
     Returns:
         House number (1-12)
     """
-    house = transit_moon_sign - natal_moon_sign + 1
-    if house <= 0:
-        house += 12
-    return house
+    if 1 <= natal_moon_sign <= 12 and 1 <= transit_moon_sign <= 12:
+        return _HOUSE_TABLE[natal_moon_sign - 1][transit_moon_sign - 1]
+    return _calculate_house_from_moon_arith(natal_moon_sign, transit_moon_sign)
+
+
+def _murthi_fields(natal_moon_sign: int, moon_sign_at_planet_entry: int) -> Tuple[str, int, str]:
+    """(murthi_type, moon_house_at_entry, result_quality) for a sign pair."""
+    house = calculate_house_from_moon(natal_moon_sign, moon_sign_at_planet_entry)
+    murthi_type = HOUSE_TO_MURTHI.get(house, "Unknown")
+    return murthi_type, house, MURTHI_QUALITY.get(murthi_type, "Unknown")
+
+
+# Murthi for every (natal Moon sign, Moon sign at entry) pair -- 12 x 12
+_MURTHI_TABLE: Dict[Tuple[int, int], Tuple[str, int, str]] = {
+    (natal, entry): _murthi_fields(natal, entry)
+    for natal in range(1, 13)
+    for entry in range(1, 13)
+}
 
 
 def get_murthi_for_transit(
     natal_moon_sign: int,
     moon_sign_at_planet_entry: int
-) -> Dict[str, any]:
+) -> MurthiTransit:
     """
     Determine the Murthi (form) of a planet's transit through a sign.
     
@@ -74,14 +132,10 @@ def get_murthi_for_transit(
         Jupiter entered Aries:
         House = 11 - 12 + 1 + 12 = 12 (Loha/Iron - Highly Unfavorable)
     """
-    house = calculate_house_from_moon(natal_moon_sign, moon_sign_at_planet_entry)
-    murthi_type = HOUSE_TO_MURTHI.get(house, "Unknown")
-    
-    result_quality = "Unknown"
-    for murthi, (houses, quality) in MURTHI_DATA.items():
-        if murthi == murthi_type:
-            result_quality = quality
-            break
+    fields = _MURTHI_TABLE.get((natal_moon_sign, moon_sign_at_planet_entry))
+    if fields is None:
+        fields = _murthi_fields(natal_moon_sign, moon_sign_at_planet_entry)
+    murthi_type, house, result_quality = fields
     
     return {
         "murthi_type": murthi_type,
@@ -119,14 +173,4 @@ def get_murthi_description(murthi_type: str) -> str:
     Returns:
         Description string
     """
-    descriptions = {
-        "Swarna": "Golden Form (Swarna Murthi) - The planet bestows its full positive results. "
-                  "This is the most auspicious form for transit.",
-        "Rajata": "Silver Form (Rajata Murthi) - The planet gives good results, "
-                  "approximately 3/4 of its potential.",
-        "Taamra": "Copper Form (Taamra Murthi) - The planet's results are mixed or reduced. "
-                  "Only about half the expected results manifest.",
-        "Loha": "Iron Form (Loha Murthi) - The planet's positive results are severely restricted. "
-                "Even favorable transits may not yield expected benefits.",
-    }
-    return descriptions.get(murthi_type, "Unknown Murthi type")
+    return MURTHI_DESCRIPTIONS.get(murthi_type, "Unknown Murthi type")
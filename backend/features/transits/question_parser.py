@@ -16,8 +16,13 @@ Examples:
 - "What about my health?"
 """
 from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from itertools import chain
+import heapq
+import json
 import re
 
 from .area_analysis import (
@@ -39,7 +44,7 @@ class QueryType(str, Enum):
     WHAT_IF = "what_if"  # Hypothetical questions
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedQuery:
     """Result of parsing a natural language query"""
     original_query: str
@@ -138,104 +143,244 @@ TIME_PATTERNS = {
 }
 
 
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]()|\\")
+
+
+def _split_literals(patterns_by_key: Dict, combine: bool = False) -> List[Tuple]:
+    """
+    Split each key's patterns into plain keywords (looked up in the set
+    returned by _keyword_hits) and compiled regexes: [(key, keywords, regexes)].
+    
+    With combine=True a key's regex patterns are compiled into a single
+    alternation (one search per key); use it only where the number of
+    matching patterns does not matter.
+    """
+    matchers = []
+    for key, patterns in patterns_by_key.items():
+        keywords = tuple(p for p in patterns if _REGEX_METACHARACTERS.isdisjoint(p))
+        sources = [p for p in patterns if not _REGEX_METACHARACTERS.isdisjoint(p)]
+        if combine and sources:
+            sources = ["|".join(f"(?:{p})" for p in sources)]
+        regexes = tuple(re.compile(p) for p in sources)
+        matchers.append((key, keywords, regexes))
+    return matchers
+
+
+def _keyword_trie_pattern(keywords) -> str:
+    """
+    Regex source matching any of the keywords, factored into a trie so that
+    each position tries one branch per distinct next character rather than
+    every keyword. Longer keywords win over their prefixes.
+    """
+    trie: Dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    
+    def emit(node: Dict) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+    
+    return emit(trie)
+
+
+# Nearly every pattern is a plain keyword, so a single keyword scan does most
+# of the matching; only the few real regexes go through their own search.
+# Areas keep one regex per pattern because the primary area's pattern
+# matches are counted.
+_AREA_MATCHERS = _split_literals(AREA_PATTERNS)
+_QUERY_TYPE_MATCHERS = _split_literals(QUERY_TYPE_PATTERNS, combine=True)
+
+# Flat (keyword, time_key) index over TIME_PATTERNS, whose patterns are all
+# plain keywords. The last matching time context wins, so contexts are
+# listed in reverse and the first hit decides.
+_TIME_INDEX = tuple(
+    (keyword, time_key)
+    for time_key, keywords in reversed(TIME_PATTERNS.items())
+    for keyword in keywords
+)
+
+
+# Secondary areas reported beyond the primary one
+_MAX_SECONDARY_AREAS = 3
+
+# Only this much of a query is parsed. Patterns such as "business.*go"
+# backtrack in time quadratic in the input, so very long input must not
+# reach them.
+_MAX_QUERY_LENGTH = 500
+
+# Keywords marking a general (not area-specific) query. Matched anywhere in
+# the query (no word boundaries), so "lifestyle" counts as "life".
+_GENERAL_KEYWORDS = ("overall", "general", "life", "future", "outlook")
+
+# Query types answered as a general outlook when no area is detected
+_GENERAL_FALLBACK_TYPES = frozenset([QueryType.YES_NO, QueryType.GENERAL_OUTLOOK])
+
+# Every plain keyword of the area, query type, time and general checks. One
+# overlapping scan finds the longest keyword starting at each position; the
+# shorter keywords found there are its prefixes, listed in _KEYWORD_PREFIXES.
+_SCAN_KEYWORDS = frozenset(chain(
+    chain.from_iterable(keywords for _, keywords, _ in _AREA_MATCHERS),
+    chain.from_iterable(keywords for _, keywords, _ in _QUERY_TYPE_MATCHERS),
+    (keyword for keyword, _ in _TIME_INDEX),
+    _GENERAL_KEYWORDS,
+))
+_KEYWORD_SCAN = re.compile(f"(?=({_keyword_trie_pattern(_SCAN_KEYWORDS)}))")
+_KEYWORD_PREFIXES = {
+    keyword: tuple(other for other in _SCAN_KEYWORDS if keyword.startswith(other))
+    for keyword in _SCAN_KEYWORDS
+}
+
+
+def _keyword_hits(query_lower: str) -> set:
+    """All scan keywords occurring anywhere in the query, found in one pass."""
+    hits = set()
+    for match in _KEYWORD_SCAN.finditer(query_lower):
+        hits.update(_KEYWORD_PREFIXES[match.group(1)])
+    return hits
+
+
+def _matches_any(query_lower: str, hits: set, keywords: Tuple[str, ...], regexes: Tuple) -> bool:
+    """True if any keyword is among the hits or any regex matches the query."""
+    return not hits.isdisjoint(keywords) or any(
+        regex.search(query_lower) for regex in regexes
+    )
+
+
 def parse_query(query: str) -> ParsedQuery:
     """
     Parse a natural language query about astrology.
     
     Args:
-        query: Natural language question
+        query: Natural language question (only the first _MAX_QUERY_LENGTH
+            characters are parsed; original_query keeps the full text)
     
     Returns:
         ParsedQuery with extracted information
     """
-    query_lower = query.lower().strip()
+    query_type, primary_area, secondary_areas, time_context, intent, confidence = (
+        _parse_normalized(query.lower().strip()[:_MAX_QUERY_LENGTH])
+    )
+    
+    return ParsedQuery(
+        original_query=query,
+        query_type=query_type,
+        primary_area=primary_area,
+        secondary_areas=list(secondary_areas),
+        time_context=time_context,
+        intent=intent,
+        confidence=confidence,
+    )
+
+
+@lru_cache(maxsize=256)
+def _parse_normalized(query_lower: str) -> Tuple:
+    """
+    Parse a lowercased, stripped query (memoized).
+    
+    Returns (query_type, primary_area, secondary_areas, time_context,
+    intent, confidence), with secondary_areas as a tuple.
+    """
+    # Area, query type, time and general keywords all come from one scan
+    hits = _keyword_hits(query_lower)
     
     # Detect primary area
     primary_area = None
     secondary_areas = []
     max_confidence = 0.0
     
-    for area, patterns in AREA_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, query_lower):
-                if primary_area is None:
-                    primary_area = area
-                    max_confidence = 0.8
-                else:
-                    if area not in secondary_areas:
-                        secondary_areas.append(area)
+    # The first matching area is primary and later ones secondary (up to
+    # _MAX_SECONDARY_AREAS). The primary area is also listed as secondary
+    # when more than one of its own patterns matches.
+    for area, keywords, regexes in _AREA_MATCHERS:
+        if not _matches_any(query_lower, hits, keywords, regexes):
+            continue
+        if primary_area is None:
+            primary_area = area
+            max_confidence = 0.8
+            own_matches = chain(
+                (keyword for keyword in keywords if keyword in hits),
+                (regex for regex in regexes if regex.search(query_lower)),
+            )
+            next(own_matches)
+            if next(own_matches, None) is not None:
+                secondary_areas.append(area)
+        else:
+            secondary_areas.append(area)
+        if len(secondary_areas) >= _MAX_SECONDARY_AREAS:
+            break
     
     # If no specific area found, might be general query
     if primary_area is None:
         # Check for general keywords
-        if any(word in query_lower for word in ["overall", "general", "life", "future", "outlook"]):
+        if not hits.isdisjoint(_GENERAL_KEYWORDS):
             primary_area = "general"
             max_confidence = 0.6
     
     # Detect query type
     query_type = QueryType.AREA_SPECIFIC  # Default
     
-    for q_type, patterns in QUERY_TYPE_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, query_lower):
-                query_type = q_type
-                break
+    for q_type, keywords, regexes in _QUERY_TYPE_MATCHERS:
+        if _matches_any(query_lower, hits, keywords, regexes):
+            query_type = q_type
     
     # If no area detected but asking general question
-    if primary_area is None and query_type in [QueryType.YES_NO, QueryType.GENERAL_OUTLOOK]:
+    if primary_area is None and query_type in _GENERAL_FALLBACK_TYPES:
         query_type = QueryType.GENERAL_OUTLOOK
         primary_area = "general"
         max_confidence = 0.5
     
     # Detect time context
     time_context = "now"  # Default
-    for time_key, patterns in TIME_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, query_lower):
-                time_context = time_key
-                break
+    for keyword, time_key in _TIME_INDEX:
+        if keyword in hits:
+            time_context = time_key
+            break
     
     # Generate intent description
     intent = _generate_intent(primary_area, query_type, time_context)
     
-    return ParsedQuery(
-        original_query=query,
-        query_type=query_type,
-        primary_area=primary_area,
-        secondary_areas=secondary_areas,
-        time_context=time_context,
-        intent=intent,
-        confidence=max_confidence,
+    return (
+        query_type, primary_area, tuple(secondary_areas), time_context, intent, max_confidence
     )
 
 
+# Possessive description of each time context, for intents
+_TIME_DESCRIPTIONS = {
+    "now": "current",
+    "this_week": "this week's",
+    "this_month": "this month's",
+    "this_year": "this year's",
+    "next_3_months": "next 3 months'",
+    "next_6_months": "next 6 months'",
+}
+
+# Intent description for an area query, by query type
+_INTENT_TEMPLATES = {
+    QueryType.YES_NO: "Yes/no question about {area}",
+    QueryType.TIMING: "Timing question about {area}",
+    QueryType.COMPARISON: "Comparison involving {area}",
+}
+_DEFAULT_INTENT_TEMPLATE = "Inquiry about {time} {area} outlook"
+
+
 def _generate_intent(area: Optional[str], query_type: QueryType, time_context: str) -> str:
     """Generate a description of the query intent."""
-    time_desc = {
-        "now": "current",
-        "this_week": "this week's",
-        "this_month": "this month's",
-        "this_year": "this year's",
-        "next_3_months": "next 3 months'",
-        "next_6_months": "next 6 months'",
-    }.get(time_context, "current")
+    time_desc = _TIME_DESCRIPTIONS.get(time_context, "current")
     
     if area == "general" or area is None:
         return f"Asking about {time_desc} overall transit outlook"
     
-    area_display = area.replace("_", " ")
-    
-    if query_type == QueryType.YES_NO:
-        return f"Yes/no question about {area_display}"
-    elif query_type == QueryType.TIMING:
-        return f"Timing question about {area_display}"
-    elif query_type == QueryType.COMPARISON:
-        return f"Comparison involving {area_display}"
-    else:
-        return f"Inquiry about {time_desc} {area_display} outlook"
+    template = _INTENT_TEMPLATES.get(query_type, _DEFAULT_INTENT_TEMPLATE)
+    return template.format(area=area.replace("_", " "), time=time_desc)
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryResponse:
     """Response to a parsed query"""
     query: ParsedQuery
@@ -279,12 +424,8 @@ def generate_response(
     )
     
     # Generate answer based on query type (now includes reasoning)
-    if query_type == QueryType.YES_NO:
-        answer = _generate_yes_no_answer(parsed_query, area_result, detailed_explanation)
-    elif query_type == QueryType.TIMING:
-        answer = _generate_timing_answer(parsed_query, area_result, detailed_explanation)
-    else:
-        answer = _generate_detailed_answer(parsed_query, area_result, detailed_explanation)
+    answer_builder = _ANSWER_BUILDERS.get(query_type, _generate_detailed_answer)
+    answer = answer_builder(parsed_query, area_result, detailed_explanation)
     
     # Determine confidence
     if area_result.confidence == "High" and parsed_query.confidence >= 0.7:
@@ -323,6 +464,11 @@ def generate_response(
     )
 
 
+def _area_score(item: Tuple[str, object]) -> float:
+    """Sort key for ``(area, AreaAnalysisResult)`` pairs."""
+    return item[1].score
+
+
 def _handle_general_query(
     parsed_query: ParsedQuery,
     transit_results: List[Dict],
@@ -332,10 +478,12 @@ def _handle_general_query(
     # Analyze all major areas
     all_areas = get_all_area_analysis(transit_results)
     
-    # Find best and worst areas
-    sorted_areas = sorted(all_areas.items(), key=lambda x: x[1].score, reverse=True)
-    best_areas = [a[0] for a in sorted_areas[:2] if a[1].score > 0]
-    challenging_areas = [a[0] for a in sorted_areas[-2:] if a[1].score < 0]
+    # Find best and worst areas. Scanning the reversed items and flipping the
+    # result keeps ties in the same order a full descending sort would.
+    best = heapq.nlargest(2, all_areas.items(), key=_area_score)
+    worst = heapq.nsmallest(2, reversed(all_areas.items()), key=_area_score)[::-1]
+    best_areas = [a[0] for a in best if a[1].score > 0]
+    challenging_areas = [a[0] for a in worst if a[1].score < 0]
     
     # Calculate overall score
     total_score = sum(a.score for a in all_areas.values())
@@ -396,17 +544,18 @@ def _generate_yes_no_answer(parsed_query: ParsedQuery, area_result, detailed_exp
     
     # Add detailed reasoning if available
     if detailed_explanation:
-        why = f"\n\n**Why this conclusion:**\n{detailed_explanation.why_this_conclusion}"
-        
-        steps = "\n\n**Analysis Steps:**"
+        parts = [
+            base,
+            f"\n\n**Why this conclusion:**\n{detailed_explanation.why_this_conclusion}",
+            "\n\n**Analysis Steps:**",
+        ]
         for i, step in enumerate(detailed_explanation.conclusion_steps[:3], 1):
-            steps += f"\n{i}. {step}"
+            parts.append(f"\n{i}. {step}")
         
-        refs = ""
         if detailed_explanation.textbook_references:
-            refs = f"\n\n**Textbook Reference:** {detailed_explanation.textbook_references[0]}"
+            parts.append(f"\n\n**Textbook Reference:** {detailed_explanation.textbook_references[0]}")
         
-        return f"{base}{why}{steps}{refs}"
+        return "".join(parts)
     
     return f"{base} {area_result.short_term_prediction}"
 
@@ -426,21 +575,24 @@ def _generate_timing_answer(parsed_query: ParsedQuery, area_result, detailed_exp
     
     # Add detailed reasoning if available
     if detailed_explanation:
-        why = f"\n\n**Timing Factors:**\n{detailed_explanation.why_this_conclusion}"
-        
-        factors = "\n\n**Key Influences:**"
+        parts = [
+            base,
+            f"\n\n**Timing Factors:**\n{detailed_explanation.why_this_conclusion}",
+            "\n\n**Key Influences:**",
+        ]
         for factor in detailed_explanation.supporting_factors[:2]:
             if isinstance(factor, dict):
-                factors += f"\n• ✓ {factor.get('planet', '')} in {factor.get('house', '')}th: {factor.get('textbook_result', '')}"
+                parts.append(f"\n• ✓ {factor.get('planet', '')} in {factor.get('house', '')}th: {factor.get('textbook_result', '')}")
             else:
-                factors += f"\n• ✓ {factor}"
+                parts.append(f"\n• ✓ {factor}")
         for factor in detailed_explanation.challenging_factors[:2]:
             if isinstance(factor, dict):
-                factors += f"\n• ✗ {factor.get('planet', '')} in {factor.get('house', '')}th: {factor.get('textbook_result', '')}"
+                parts.append(f"\n• ✗ {factor.get('planet', '')} in {factor.get('house', '')}th: {factor.get('textbook_result', '')}")
             else:
-                factors += f"\n• ✗ {factor}"
+                parts.append(f"\n• ✗ {factor}")
         
-        return f"{base}{why}{factors}\n\n**Advice:** {area_result.advice}"
+        parts.append(f"\n\n**Advice:** {area_result.advice}")
+        return "".join(parts)
     
     return f"{base} {area_result.advice}"
 
@@ -507,23 +659,34 @@ def _generate_detailed_answer(parsed_query: ParsedQuery, area_result, detailed_e
     return " ".join(parts)
 
 
+# Answer builder by query type (others get the detailed answer)
+_ANSWER_BUILDERS = {
+    QueryType.YES_NO: _generate_yes_no_answer,
+    QueryType.TIMING: _generate_timing_answer,
+}
+
+
+# Areas suggested as follow-ups for each area; only the first is offered
+_RELATED_AREAS: Dict[str, Tuple[str, ...]] = {
+    "career": ("finance", "education"),
+    "finance": ("career", "business"),
+    "health": ("longevity", "family"),
+    "marriage": ("relationships", "family"),
+    "education": ("career", "travel"),
+    "travel": ("career", "foreign"),
+}
+
+_OVERALL_OUTLOOK_FOLLOW_UP = "What is my overall outlook?"
+
+
 def _generate_follow_ups(area: str, area_result) -> List[str]:
     """Generate follow-up question suggestions."""
     follow_ups = []
     
     # Related area suggestions
-    related_areas = {
-        "career": ["finance", "education"],
-        "finance": ["career", "business"],
-        "health": ["longevity", "family"],
-        "marriage": ["relationships", "family"],
-        "education": ["career", "travel"],
-        "travel": ["career", "foreign"],
-    }
-    
-    if area in related_areas:
-        for related in related_areas[area][:1]:
-            follow_ups.append(f"How is my {related}?")
+    related_areas = _RELATED_AREAS.get(area, ())
+    if related_areas:
+        follow_ups.append(f"How is my {related_areas[0]}?")
     
     # Based on outlook
     if area_result.overall_outlook == "Challenging":
@@ -532,9 +695,15 @@ def _generate_follow_ups(area: str, area_result) -> List[str]:
         follow_ups.append(f"When is the best time for {area} decisions?")
     
     # Generic follow-ups
-    follow_ups.append("What is my overall outlook?")
+    follow_ups.append(_OVERALL_OUTLOOK_FOLLOW_UP)
     
-    return follow_ups[:3]
+    return follow_ups
+
+
+# LRU of process_question results keyed by (question, serialized transits).
+# Cached responses are shared, so callers must treat nested values as read-only.
+_RESPONSE_CACHE_SIZE = 128
+_RESPONSE_CACHE: "OrderedDict[Tuple[str, str], Dict]" = OrderedDict()
 
 
 def process_question(
@@ -553,13 +722,22 @@ def process_question(
     Returns:
         Dict with response and metadata
     """
+    # Repeated questions against the same transits reuse the earlier answer
+    cache_key = None
+    if enhanced_report is None:
+        cache_key = (question, json.dumps(transit_results, sort_keys=True, default=str))
+        cached = _RESPONSE_CACHE.get(cache_key)
+        if cached is not None:
+            _RESPONSE_CACHE.move_to_end(cache_key)
+            return dict(cached)
+    
     # Parse the query
     parsed = parse_query(question)
     
     # Generate response
     response = generate_response(parsed, transit_results, enhanced_report)
     
-    return {
+    result = {
         "question": question,
         "parsed_intent": parsed.intent,
         "area": parsed.primary_area,
@@ -568,3 +746,11 @@ def process_question(
         "detailed_analysis": response.detailed_analysis,
         "follow_up_suggestions": response.follow_up_suggestions,
     }
+    
+    if cache_key is not None:
+        _RESPONSE_CACHE[cache_key] = result
+        if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_SIZE:
+            _RESPONSE_CACHE.popitem(last=False)
+        result = dict(result)
+    
+    return result
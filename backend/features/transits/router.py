@@ -13,14 +13,17 @@ from fastapi import APIRouter, HTTPException, Query
 from datetime import datetime, date
 from typing import Optional, Dict, List
 from pydantic import BaseModel
-import swisseph as swe
 
-from .types import TransitRequest, TransitResponse, TransitReport
+from .types import TransitRequest, TransitResponse, TransitReport, SIGN_NAMES, NAKSHATRA_NAMES
 from .analyzer import create_transit_report
 from .enhanced_analyzer import EnhancedTransitAnalyzer, create_enhanced_transit_report
 from .area_analysis import analyze_area, get_all_area_analysis, AREA_ICONS
 from .question_parser import process_question, parse_query
-from .timeline_analysis import calculate_yearly_timeline, calculate_all_areas_timeline
+from .timeline_analysis import (
+    calculate_yearly_timeline,
+    calculate_all_areas_timeline,
+    planetary_positions_at,
+)
 
 router = APIRouter(prefix="/transit", tags=["Transit Analysis"])
 
@@ -81,29 +84,7 @@ def get_planetary_positions(year: int, month: int, day: int, hour: int = 12, min
     Get planetary positions using Swiss Ephemeris.
     Returns sidereal longitudes (Lahiri ayanamsa).
     """
-    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
-    jd = swe.julday(year, month, day, hour + minute / 60.0)
-    
-    planets = {
-        "Sun": swe.SUN,
-        "Moon": swe.MOON,
-        "Mars": swe.MARS,
-        "Mercury": swe.MERCURY,
-        "Jupiter": swe.JUPITER,
-        "Venus": swe.VENUS,
-        "Saturn": swe.SATURN,
-        "Rahu": swe.TRUE_NODE,
-    }
-    
-    positions = {}
-    for name, code in planets.items():
-        result = swe.calc_ut(jd, code, swe.FLG_SIDEREAL)
-        positions[name] = result[0][0]  # Longitude
-    
-    # Ketu is always 180° from Rahu
-    positions["Ketu"] = (positions["Rahu"] + 180) % 360
-    
-    return positions
+    return dict(planetary_positions_at(year, month, day, hour, minute))
 
 
 def get_nakshatra_from_longitude(longitude: float) -> int:
@@ -188,24 +169,15 @@ async def get_current_positions():
         
         # Add sign and nakshatra info
         detailed_positions = {}
-        sign_names = ["", "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
-                      "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
-        nakshatra_names = [
-            "", "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra",
-            "Punarvasu", "Pushya", "Ashlesha", "Magha", "Purva Phalguni", "Uttara Phalguni",
-            "Hasta", "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshtha",
-            "Mula", "Purva Ashadha", "Uttara Ashadha", "Shravana", "Dhanishtha",
-            "Shatabhisha", "Purva Bhadrapada", "Uttara Bhadrapada", "Revati"
-        ]
-        
         for planet, longitude in positions.items():
-            sign = get_sign_from_longitude(longitude)
+            # One divmod gives both the sign (0-based) and the degree within it
+            sign_offset, sign_degree = divmod(longitude, 30)
             nakshatra = get_nakshatra_from_longitude(longitude)
             detailed_positions[planet] = {
                 "longitude": round(longitude, 2),
-                "sign": sign_names[sign],
-                "sign_degree": round(longitude % 30, 2),
-                "nakshatra": nakshatra_names[nakshatra],
+                "sign": SIGN_NAMES[int(sign_offset) + 1],
+                "sign_degree": round(sign_degree, 2),
+                "nakshatra": NAKSHATRA_NAMES[nakshatra],
             }
         
         return {
@@ -295,14 +267,21 @@ async def enhanced_transit_analysis(request: EnhancedTransitRequest):
             request.hour, request.minute
         )
         
+        # Natal signs for Ashtakavarga, computed once; Moon and lagna reuse them
+        natal_signs = {
+            planet: int(longitude // 30) + 1
+            for planet, longitude in natal_positions.items()
+        }
+        
         natal_moon_longitude = natal_positions["Moon"]
-        natal_moon_sign = get_sign_from_longitude(natal_moon_longitude)
+        natal_moon_sign = natal_signs["Moon"]
         natal_moon_nakshatra = get_nakshatra_from_longitude(natal_moon_longitude)
         
         # Calculate natal lagna (use Sun as approximate if needed)
         natal_lagna_longitude = natal_positions["Sun"]  # Simplified - ideally calculate true lagna
-        natal_lagna_sign = get_sign_from_longitude(natal_lagna_longitude)
+        natal_lagna_sign = natal_signs["Sun"]
         natal_lagna_nakshatra = get_nakshatra_from_longitude(natal_lagna_longitude)
+        natal_signs["Lagna"] = natal_lagna_sign
         
         # Get transit date
         if request.transit_year and request.transit_month and request.transit_day:
@@ -315,13 +294,6 @@ async def enhanced_transit_analysis(request: EnhancedTransitRequest):
             transit_date.year, transit_date.month, transit_date.day
         )
         
-        # Create natal positions dict for Ashtakavarga
-        natal_signs = {
-            planet: get_sign_from_longitude(long) 
-            for planet, long in natal_positions.items()
-        }
-        natal_signs["Lagna"] = natal_lagna_sign
-        
         # Create enhanced report
         report = create_enhanced_transit_report(
             natal_moon_sign=natal_moon_sign,
@@ -12,6 +12,7 @@ Based on:
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import date, timedelta
+from functools import lru_cache
 import swisseph as swe
 
 
@@ -77,29 +78,57 @@ MONTH_NAMES = [
 ]
 
 
-def get_planetary_positions_for_date(target_date: date) -> Dict[str, float]:
-    """Get planetary positions for a specific date."""
+# Swiss Ephemeris body codes, in the order positions are reported (Ketu last)
+PLANET_CODES = (
+    ("Sun", swe.SUN),
+    ("Moon", swe.MOON),
+    ("Mars", swe.MARS),
+    ("Mercury", swe.MERCURY),
+    ("Jupiter", swe.JUPITER),
+    ("Venus", swe.VENUS),
+    ("Saturn", swe.SATURN),
+    ("Rahu", swe.TRUE_NODE),
+)
+
+
+def planetary_positions_at(
+    year: int, month: int, day: int, hour: int = 12, minute: int = 0
+) -> Tuple[Tuple[str, float], ...]:
+    """
+    Sidereal (Lahiri) longitudes for one moment as (planet, longitude) pairs.
+    
+    Memoized and shared with the router: every endpoint asks for today's
+    noon positions, and a timeline over all areas revisits the same 12 dates
+    once per area.
+    """
+    # Always pass all five fields positionally so that defaulted and explicit
+    # noon lookups share one cache entry
+    return _positions_at(year, month, day, hour, minute)
+
+
+@lru_cache(maxsize=4096)
+def _positions_at(
+    year: int, month: int, day: int, hour: int, minute: int
+) -> Tuple[Tuple[str, float], ...]:
+    """Memoized worker behind planetary_positions_at, keyed on all five fields."""
+    # Set on every miss: other modules may switch the global ayanamsa mode
     swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
-    jd = swe.julday(target_date.year, target_date.month, target_date.day, 12.0)
+    jd = swe.julday(year, month, day, hour + minute / 60.0)
     
-    planets = {
-        "Sun": swe.SUN,
-        "Moon": swe.MOON,
-        "Mars": swe.MARS,
-        "Mercury": swe.MERCURY,
-        "Jupiter": swe.JUPITER,
-        "Venus": swe.VENUS,
-        "Saturn": swe.SATURN,
-        "Rahu": swe.TRUE_NODE,
-    }
+    positions = [
+        (name, swe.calc_ut(jd, code, swe.FLG_SIDEREAL)[0][0])  # Longitude
+        for name, code in PLANET_CODES
+    ]
     
-    positions = {}
-    for name, code in planets.items():
-        result = swe.calc_ut(jd, code, swe.FLG_SIDEREAL)
-        positions[name] = result[0][0]
+    # Ketu is always 180° from Rahu
+    positions.append(("Ketu", (positions[-1][1] + 180) % 360))
     
-    positions["Ketu"] = (positions["Rahu"] + 180) % 360
-    return positions
+    return tuple(positions)
+
+
+def get_planetary_positions_for_date(target_date: date) -> Dict[str, float]:
+    """Get planetary positions for a specific date."""
+    return dict(planetary_positions_at(target_date.year, target_date.month, target_date.day))
 
 
 def get_house_from_moon(transit_longitude: float, natal_moon_sign: int) -> int:
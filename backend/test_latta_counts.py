@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Test that the batch latta scans agree with the per-date latta analysis"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from features.transits.latta import (
+    analyze_latta_effects,
+    check_latta_on_nakshatra,
+    count_lattas_by_date,
+    scan_latta_on_nakshatra,
+)
+
+PLANETS = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Rahu", "Ketu"]
+
+# In-range nakshatras plus the edges and values outside 1-27
+EDGE_NAKSHATRAS = [1, 27, 0, -1, 28, 40, -40, -60, 100]
+
+
+def random_nakshatra():
+    if random.random() < 0.3:
+        return random.choice(EDGE_NAKSHATRAS)
+    return random.randint(1, 27)
+
+
+random.seed(0)
+failures = 0
+
+for trial in range(2000):
+    janma = random_nakshatra()
+    lagna = random.choice([janma, random_nakshatra()])
+    by_date = {
+        f"day{day}": {
+            planet: random_nakshatra()
+            for planet in random.sample(PLANETS, random.randint(0, len(PLANETS)))
+        }
+        for day in range(5)
+    }
+    
+    counts = count_lattas_by_date(janma, lagna, by_date)
+    scanned = scan_latta_on_nakshatra(janma, by_date)
+    
+    for date, planet_nakshatras in by_date.items():
+        expected = analyze_latta_effects(janma, lagna, dict(planet_nakshatras))
+        if counts[date] != expected["overall_latta_count"]:
+            failures += 1
+            print(f'❌ count mismatch: janma={janma} lagna={lagna} {planet_nakshatras}: '
+                  f'{counts[date]} != {expected["overall_latta_count"]}')
+        
+        hits = check_latta_on_nakshatra(janma, dict(planet_nakshatras))
+        if scanned[date] != [hit["planet"] for hit in hits]:
+            failures += 1
+            print(f'❌ scan mismatch: janma={janma} {planet_nakshatras}: '
+                  f'{scanned[date]} != {[hit["planet"] for hit in hits]}')
+
+if failures:
+    print(f'❌ {failures} mismatches')
+    sys.exit(1)
+
+print('✅ count_lattas_by_date and scan_latta_on_nakshatra match the per-date analysis')